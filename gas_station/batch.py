@@ -0,0 +1,90 @@
+"""
+Пакетный (неинтерактивный) режим: команды в формате JSON, по одной на строку
+"""
+import json
+from dataclasses import asdict
+from typing import Dict, TextIO
+from operations import AZSOperations
+
+# Команда -> метод AZSOperations, возвращающий (успех, сообщение)
+ACTIONS = {
+    "sale": "serve_customer",
+    "refuel": "refuel_cistern",
+    "transfer": "transfer_fuel",
+    "toggle_cistern": "toggle_cistern",
+    "emergency": "trigger_emergency",
+    "disable_emergency": "disable_emergency",
+    "reload_config": "reload_config"
+}
+
+# Команда -> (метод AZSOperations, возвращающий данные отчёта, допустимые параметры)
+REPORTS = {
+    "cisterns": ("get_cistern_status", ()),
+    "columns": ("get_column_status", ()),
+    "statistics": ("get_statistics", ()),
+    "history": ("get_history", ("limit",)),
+    "reconcile": ("reconcile", ())
+}
+
+
+class AZSBatch:
+    """Выполнение потока команд с сохранением данных пачками"""
+
+    def __init__(self, azs: AZSOperations, flush_every: int = 1000):
+        self.azs = azs
+        self.flush_every = flush_every
+
+    def execute(self, command: Dict) -> Dict:
+        """Выполнение одной команды, например {"cmd": "sale", "column_id": 1, "fuel_type": "АИ-95", "liters": 30}"""
+        params = dict(command)
+        name = params.pop("cmd", None)
+        try:
+            if name in ACTIONS:
+                try:
+                    success, message = getattr(self.azs, ACTIONS[name])(**params)
+                finally:
+                    # Как и в консоли: цистерна ниже минимального уровня отключается сразу
+                    self.azs.check_low_levels()
+                return {"ok": success, "message": message}
+            if name in REPORTS:
+                method, allowed = REPORTS[name]
+                unknown = set(params) - set(allowed)
+                if unknown:
+                    return {"ok": False, "error": f"Неверные параметры команды {name}: {', '.join(sorted(unknown))}"}
+                result = getattr(self.azs, method)(**params)
+                if name == "history":
+                    # Детали с именами полей, а не списком значений, как в history.json
+                    result = [asdict(op) for op in result]
+                return {"ok": True, "result": result}
+        except TypeError as e:
+            return {"ok": False, "error": f"Неверные параметры команды {name}: {e}"}
+        except Exception as e:
+            # Ошибка одной команды не должна прерывать весь пакет
+            return {"ok": False, "error": f"Ошибка выполнения команды {name}: {e}"}
+        return {"ok": False, "error": f"Неизвестная команда: {name}"}
+
+    def run(self, stream: TextIO, out: TextIO) -> int:
+        """Выполнение всех команд из потока, возвращает число ошибок"""
+        errors = 0
+        with self.azs.batch():
+            for count, line in enumerate(stream, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    command = json.loads(line)
+                except json.JSONDecodeError as e:
+                    result = {"ok": False, "error": f"Ошибка разбора JSON: {e}"}
+                else:
+                    if isinstance(command, dict):
+                        result = self.execute(command)
+                    else:
+                        result = {"ok": False, "error": "Команда должна быть объектом JSON"}
+
+                if not result["ok"]:
+                    errors += 1
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+                if count % self.flush_every == 0:
+                    self.azs.flush()
+        return errors
@@ -0,0 +1,108 @@
+"""
+Конфигурация станции: цистерны, колонки и цены на топливо
+"""
+import json
+import os
+from typing import List, Dict, Tuple
+
+# Рядом с модулем, чтобы программа запускалась из любого каталога
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "station.json")
+
+# Разобранные конфигурации: путь -> (время изменения файла, конфигурация)
+_cache: Dict[str, Tuple[float, "StationConfig"]] = {}
+
+
+class StationConfig:
+    """Проверенная конфигурация станции с готовыми таблицами маршрутизации"""
+
+    def __init__(self, data: Dict):
+        self.fuel_prices: Dict[str, float] = {}
+        self.cisterns: List[Dict] = []
+        self.columns: List[Dict] = []
+        # (номер колонки, тип топлива) -> id цистерны
+        self.routes: Dict[Tuple[int, str], str] = {}
+
+        self._parse_prices(data.get("fuel_prices"))
+        self._parse_cisterns(data.get("cisterns"))
+        self._parse_columns(data.get("columns"))
+
+    def _parse_prices(self, prices):
+        if not isinstance(prices, dict) or not prices:
+            raise ValueError("Конфигурация: не заданы цены на топливо (fuel_prices)")
+        for fuel_type, price in prices.items():
+            if not isinstance(price, (int, float)) or price <= 0:
+                raise ValueError(f"Конфигурация: неверная цена для {fuel_type}")
+            self.fuel_prices[fuel_type] = float(price)
+
+    def _parse_cisterns(self, cisterns):
+        if not isinstance(cisterns, list) or not cisterns:
+            raise ValueError("Конфигурация: не заданы цистерны (cisterns)")
+        seen = set()
+        for item in cisterns:
+            try:
+                cistern = {
+                    "id": str(item["id"]),
+                    "fuel_type": item["fuel_type"],
+                    "max_volume": float(item["max_volume"]),
+                    "current_volume": float(item.get("initial_volume", 0)),
+                    "min_level": float(item["min_level"]),
+                    "is_active": bool(item.get("is_active", True))
+                }
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Конфигурация: неполное описание цистерны {item}")
+            if cistern["id"] in seen:
+                raise ValueError(f"Конфигурация: цистерна {cistern['id']} описана дважды")
+            if cistern["fuel_type"] not in self.fuel_prices:
+                raise ValueError(f"Конфигурация: нет цены для топлива {cistern['fuel_type']}")
+            if not 0 <= cistern["min_level"] <= cistern["max_volume"]:
+                raise ValueError(f"Конфигурация: неверный минимальный уровень цистерны {cistern['id']}")
+            if not 0 <= cistern["current_volume"] <= cistern["max_volume"]:
+                raise ValueError(f"Конфигурация: неверный начальный объём цистерны {cistern['id']}")
+            seen.add(cistern["id"])
+            self.cisterns.append(cistern)
+
+    def _parse_columns(self, groups):
+        """Группы колонок {"from": 1, "to": 4, "fuels": {...}} разворачиваются в отдельные колонки"""
+        if not isinstance(groups, list) or not groups:
+            raise ValueError("Конфигурация: не заданы колонки (columns)")
+        fuel_types = {c["id"]: c["fuel_type"] for c in self.cisterns}
+        columns = {}
+        for group in groups:
+            try:
+                first, last = int(group["from"]), int(group.get("to", group["from"]))
+                fuels = dict(group["fuels"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Конфигурация: неверное описание колонок {group}")
+            if first < 1 or last < first:
+                raise ValueError(f"Конфигурация: неверный диапазон колонок {first}-{last}")
+            for fuel_type, cistern_id in fuels.items():
+                if fuel_types.get(cistern_id) != fuel_type:
+                    raise ValueError(f"Конфигурация: цистерна {cistern_id} не содержит {fuel_type}")
+            for column_id in range(first, last + 1):
+                routes = columns.setdefault(column_id, {})
+                for fuel_type, cistern_id in fuels.items():
+                    if routes.get(fuel_type, cistern_id) != cistern_id:
+                        raise ValueError(f"Конфигурация: на колонке {column_id} {fuel_type} подаётся "
+                                         f"из двух цистерн: {routes[fuel_type]} и {cistern_id}")
+                    routes[fuel_type] = cistern_id
+
+        for column_id in sorted(columns):
+            self.columns.append({"id": column_id, "available_fuels": columns[column_id], "is_active": True})
+            for fuel_type, cistern_id in columns[column_id].items():
+                self.routes[(column_id, fuel_type)] = cistern_id
+
+
+def load_config(path: str = CONFIG_FILE) -> StationConfig:
+    """Загрузка конфигурации; повторная проверка только если файл изменился"""
+    mtime = os.path.getmtime(path)
+    cached = _cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Конфигурация: ошибка разбора {path}: {e}")
+    config = StationConfig(data)
+    _cache[path] = (mtime, config)
+    return config
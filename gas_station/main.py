@@ -1,8 +1,11 @@
 """
 Главный модуль системы управления АЗС
 """
+import argparse
 import os
+import sys
 from operations import AZSOperations
+from batch import AZSBatch
 
 class AZSConsole:
     def __init__(self):
@@ -11,7 +14,11 @@ class AZSConsole:
     
     def clear_screen(self):
         """Очистка экрана"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # ANSI-последовательность вместо запуска отдельного процесса clear
+            print("\033[2J\033[H", end="")
     
     def print_header(self):
         """Вывод заголовка"""
@@ -54,13 +61,14 @@ class AZSConsole:
         
         # Выбор колонки
         print("Доступные колонки:")
-        for i in range(1, 9):
-            print(f"{i}) Колонка {i}")
+        for column in self.azs.columns:
+            print(f"{column.id}) Колонка {column.id}")
         print()
         
         try:
             column_id = int(input("Выберите колонку: "))
-            if column_id < 1 or column_id > 8:
+            column = self.azs.get_column(column_id)
+            if not column:
                 print("ОШИБКА: Неверный номер колонки")
                 return
         except ValueError:
@@ -70,7 +78,6 @@ class AZSConsole:
         print(f"\nКолонка {column_id}\n")
         
         # Выбор типа топлива
-        column = self.azs.columns[column_id - 1]
         fuels = list(column.available_fuels.keys())
         
         print("Доступные виды топлива:")
@@ -181,8 +188,8 @@ class AZSConsole:
             print(f"[{op.timestamp}] {op.description}")
             if op.operation_type == 'sale':
                 details = op.details
-                print(f"  Колонка: {details['column_id']}, Тип: {details['fuel_type']}")
-                print(f"  Количество: {details['liters']} л, Сумма: {details['total_price']:.2f} ₽")
+                print(f"  Колонка: {details.column_id}, Тип: {details.fuel_type}")
+                print(f"  Количество: {details.liters} л, Сумма: {details.total_price:.2f} ₽")
             print()
     
     def transfer_fuel_menu(self):
@@ -396,5 +403,16 @@ class AZSConsole:
                 input("\nНажмите Enter для продолжения...")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Система управления АЗС")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="неинтерактивный режим: команды JSON по одной на строку (из файла или stdin)")
+    args = parser.parse_args()
+    
+    if args.batch:
+        stream = sys.stdin if args.batch == "-" else open(args.batch, 'r', encoding='utf-8')
+        with stream:
+            errors = AZSBatch(AZSOperations()).run(stream, sys.stdout)
+        sys.exit(1 if errors else 0)
+    
     app = AZSConsole()
     app.run()
\ No newline at end of file
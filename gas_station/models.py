@@ -4,7 +4,7 @@
 import json
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
 @dataclass
 class Cistern:
@@ -55,21 +55,78 @@ class Transaction:
     def from_dict(cls, data):
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True)
+class SaleDetails:
+    """Детали продажи"""
+    column_id: int
+    fuel_type: str
+    liters: float
+    total_price: float
+    cistern_id: Optional[str] = None  # в записях старых версий не сохранялась
+
+@dataclass(slots=True)
+class RefuelDetails:
+    """Детали пополнения цистерны"""
+    cistern_id: str
+    liters: float
+
+@dataclass(slots=True)
+class TransferDetails:
+    """Детали перекачки топлива"""
+    source_id: str
+    target_id: str
+    liters: float
+    fuel_type: str
+
+@dataclass(slots=True)
+class ToggleCisternDetails:
+    """Детали включения/выключения цистерны"""
+    cistern_id: str
+    action: str  # 'enable', 'disable', 'auto_disable'
+
+@dataclass(slots=True)
+class EmergencyDetails:
+    """Детали аварийного режима"""
+    action: str  # 'emergency_activated', 'emergency_disabled'
+
+# Тип операции -> класс деталей
+OPERATION_DETAILS = {
+    "sale": SaleDetails,
+    "refuel": RefuelDetails,
+    "transfer": TransferDetails,
+    "toggle_cistern": ToggleCisternDetails,
+    "emergency": EmergencyDetails
+}
+
+OperationDetails = Union[SaleDetails, RefuelDetails, TransferDetails, ToggleCisternDetails, EmergencyDetails]
+
+@dataclass(slots=True)
 class Operation:
     """5.5 Модель операции (история)"""
     id: int
     timestamp: str
     operation_type: str  # 'sale', 'refuel', 'transfer', 'toggle_cistern', 'emergency'
     description: str
-    details: Dict
+    details: OperationDetails
     
     def to_dict(self):
-        return asdict(self)
+        # Детали хранятся списком значений в порядке полей, тип задаёт operation_type
+        details = self.details
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "operation_type": self.operation_type,
+            "description": self.description,
+            "details": [getattr(details, name) for name in details.__slots__]
+        }
     
     @classmethod
     def from_dict(cls, data):
-        return cls(**data)
+        details_cls = OPERATION_DETAILS[data["operation_type"]]
+        details = data["details"]
+        # Старый формат истории хранил детали словарём
+        details = details_cls(**details) if isinstance(details, dict) else details_cls(*details)
+        return cls(data["id"], data["timestamp"], data["operation_type"], data["description"], details)
 
 @dataclass
 class Statistics:
@@ -83,4 +140,14 @@ class Statistics:
     
     @classmethod
     def from_dict(cls, data):
-        return cls(**data)
\ No newline at end of file
+        return cls(**data)
+
+@dataclass(frozen=True)
+class StationSnapshot:
+    """Неизменяемый снимок состояния АЗС для отчётов"""
+    version: int
+    cisterns: Tuple[Cistern, ...]
+    columns: Tuple[Column, ...]
+    stats: Statistics
+    history: List[Operation]  # общий список, пополняется только в конец
+    history_size: int
@@ -1,10 +1,35 @@
 """
 Бизнес-логика системы управления АЗС
 """
+import math
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
+from functools import wraps
 from typing import List, Dict, Optional, Tuple
 from models import *
 from storage import Storage
+from config import StationConfig, load_config
+from reconcile import Reconciler
+
+def _mutation(method):
+    """Изменение состояния под блокировкой с публикацией нового снимка"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            result = method(self, *args, **kwargs)
+            self._publish_snapshot()
+        return result
+    return wrapper
+
+def _check_liters(liters) -> Optional[str]:
+    """Проверка количества литров, пришедшего из консоли или пакетной команды"""
+    if isinstance(liters, bool) or not isinstance(liters, (int, float)):
+        return "Количество литров должно быть числом"
+    if not math.isfinite(liters) or liters <= 0:
+        return "Количество должно быть положительным"
+    return None
 
 class AZSOperations:
     def __init__(self):
@@ -15,20 +40,27 @@ class AZSOperations:
         self.history = self.storage.load_history()
         self.transactions = self.storage.load_transactions()
         
-        # Цены на топливо (можно вынести в конфиг)
-        self.fuel_prices = {
-            "АИ-92": 57.47,
-            "АИ-95": 58.30,
-            "АИ-98": 64.50,
-            "ДТ": 52.00
-        }
+        # Цены и таблицы маршрутизации из конфигурации станции
+        self._apply_config(self.storage.config)
         
         # Счётчики для ID
         self.next_op_id = len(self.history) + 1
         self.next_transaction_id = len(self.transactions) + 1
         
+        # Сколько записей истории и транзакций уже есть в файлах
+        self._history_saved = len(self.history)
+        self._transactions_saved = len(self.transactions)
+        
         # Аварийный режим
         self.emergency_mode = False
+        
+        # Снимок состояния для отчётов, заменяется целиком после каждого изменения
+        self._lock = threading.Lock()
+        self._version = 0
+        self._publish_snapshot()
+        
+        # Пакетный режим: сохранение откладывается до flush()
+        self._batch_depth = 0
     
     def save_all(self):
         """Сохранение всех данных"""
@@ -36,10 +68,119 @@ class AZSOperations:
         self.storage.save_columns(self.columns)
         self.storage.save_statistics(self.stats)
     
+    def _save(self):
+        """Сохранение после операции (в пакетном режиме откладывается)"""
+        if not self._batch_depth:
+            self.save_all()
+    
+    def _save_logs(self):
+        """Дописывание в файлы ещё не сохранённых операций и транзакций (вызывается под self._lock)"""
+        end = len(self.history)
+        self.storage.append_operations(self.history[self._history_saved:end])
+        self._history_saved = end
+        end = len(self.transactions)
+        self.storage.append_transactions(self.transactions[self._transactions_saved:end])
+        self._transactions_saved = end
+    
+    def flush(self):
+        """Сохранение всех данных вместе с историей и транзакциями"""
+        with self._lock:
+            self.save_all()
+            self._save_logs()
+    
+    @contextmanager
+    def batch(self):
+        """Пакетный режим: данные записываются на диск один раз при выходе"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                finished = not self._batch_depth
+            if finished:
+                self.flush()
+    
+    def _apply_config(self, config: StationConfig):
+        """Применение конфигурации: цистерны, колонки, цены и таблицы маршрутизации"""
+        cisterns = {c.id: c for c in self.cisterns}
+        for item in config.cisterns:
+            cistern = cisterns.get(item["id"])
+            if cistern is None:
+                # Новая цистерна начинает с начального объёма из конфигурации
+                cistern = Cistern.from_dict(dict(item))
+                self.cisterns.append(cistern)
+                cisterns[cistern.id] = cistern
+            else:
+                cistern.fuel_type = item["fuel_type"]
+                cistern.max_volume = item["max_volume"]
+                cistern.min_level = item["min_level"]
+        
+        # Состояние включения колонок сохраняется между перезагрузками
+        active = {c.id: c.is_active for c in getattr(self, "columns", [])}
+        columns = [
+            Column(c["id"], dict(c["available_fuels"]), active.get(c["id"], c["is_active"]))
+            for c in config.columns
+        ]
+        
+        # Таблицы заменяются целиком, без изменения старых
+        self.config = config
+        self.fuel_prices = config.fuel_prices
+        self.routes = config.routes
+        self.columns = columns
+        self._columns_by_id = {c.id: c for c in columns}
+        self._cisterns_by_id = cisterns
+    
+    @_mutation
+    def reload_config(self) -> Tuple[bool, str]:
+        """Перечитывание конфигурации станции без перезапуска"""
+        try:
+            config = load_config()
+        except (OSError, ValueError) as e:
+            return False, str(e)
+        
+        if config is self.config:
+            return True, "Конфигурация не изменилась"
+        
+        self._apply_config(config)
+        self._save()
+        return True, "Конфигурация станции обновлена"
+    
+    def get_column(self, column_id: int) -> Optional[Column]:
+        """Колонка по номеру"""
+        return self._columns_by_id.get(column_id)
+    
+    def get_cistern(self, cistern_id: str) -> Optional[Cistern]:
+        """Цистерна по идентификатору"""
+        return self._cisterns_by_id.get(cistern_id)
+    
+    def _publish_snapshot(self):
+        """Публикация нового снимка состояния"""
+        self._version += 1
+        stats = self.stats
+        self._snapshot = StationSnapshot(
+            version=self._version,
+            cisterns=tuple(replace(c) for c in self.cisterns),
+            columns=tuple(replace(c, available_fuels=dict(c.available_fuels)) for c in self.columns),
+            stats=Statistics(
+                stats.total_cars_served,
+                stats.total_income,
+                {fuel_type: dict(data) for fuel_type, data in stats.fuel_stats.items()}
+            ),
+            history=self.history,
+            history_size=len(self.history)
+        )
+    
+    def snapshot(self) -> StationSnapshot:
+        """Текущий снимок состояния (без блокировки продаж)"""
+        return self._snapshot
+    
     def get_disabled_cisterns(self) -> List[Cistern]:
         """Получение отключённых цистерн"""
         return [c for c in self.cisterns if not c.is_active]
     
+    @_mutation
     def check_low_levels(self):
         """Проверка низкого уровня топлива в цистернах (Раздел 2.2)"""
         disabled_cisterns = []
@@ -50,30 +191,35 @@ class AZSOperations:
                     self._add_operation(
                         "toggle_cistern",
                         f"Автоматическое отключение цистерны {cistern.id} (низкий уровень)",
-                        {"cistern_id": cistern.id, "action": "auto_disable"}
+                        ToggleCisternDetails(cistern.id, "auto_disable")
                     )
                 disabled_cisterns.append(cistern)
         return disabled_cisterns
     
+    @_mutation
     def serve_customer(self, column_id: int, fuel_type: str, liters: float) -> Tuple[bool, str]:
         """5.1 Обслуживание клиента (касса)"""
         if self.emergency_mode:
             return False, "Аварийный режим! Заправка невозможна."
         
+        error = _check_liters(liters)
+        if error:
+            return False, error
+        
         # Проверка колонки
-        if column_id < 1 or column_id > len(self.columns):
+        column = self._columns_by_id.get(column_id)
+        if not column:
             return False, "Неверный номер колонки"
         
-        column = self.columns[column_id - 1]
         if not column.is_active:
             return False, "Колонка неактивна"
         
         # Проверка типа топлива
-        if fuel_type not in column.available_fuels:
+        cistern_id = self.routes.get((column_id, fuel_type))
+        if cistern_id is None:
             return False, f"Топливо {fuel_type} недоступно на этой колонке"
         
-        cistern_id = column.available_fuels[fuel_type]
-        cistern = next((c for c in self.cisterns if c.id == cistern_id), None)
+        cistern = self._cisterns_by_id.get(cistern_id)
         
         if not cistern:
             return False, f"Цистерна {cistern_id} не найдена"
@@ -115,20 +261,25 @@ class AZSOperations:
         self.stats.fuel_stats[fuel_type]["income"] += total_price
         
         # Сохранение данных
-        self.storage.add_transaction(transaction)
+        self.transactions.append(transaction)
         self._add_operation(
             "sale",
             f"Продажа {liters} л {fuel_type} на колонке {column_id}",
-            {"column_id": column_id, "fuel_type": fuel_type, "liters": liters, "total_price": total_price}
+            SaleDetails(column_id, fuel_type, liters, total_price, cistern.id)
         )
-        self.save_all()
+        self._save()
         
         self.next_transaction_id += 1
         return True, f"Успешно! Стоимость: {total_price:.2f} ₽"
     
+    @_mutation
     def refuel_cistern(self, cistern_id: str, liters: float) -> Tuple[bool, str]:
         """5.3 Оформление пополнения топлива"""
-        cistern = next((c for c in self.cisterns if c.id == cistern_id), None)
+        error = _check_liters(liters)
+        if error:
+            return False, error
+        
+        cistern = self._cisterns_by_id.get(cistern_id)
         
         if not cistern:
             return False, "Цистерна не найдена"
@@ -142,16 +293,21 @@ class AZSOperations:
         self._add_operation(
             "refuel",
             f"Пополнение цистерны {cistern_id} на {liters} л",
-            {"cistern_id": cistern_id, "liters": liters}
+            RefuelDetails(cistern_id, liters)
         )
         
-        self.save_all()
+        self._save()
         return True, f"Цистерна {cistern_id} успешно пополнена на {liters} л"
     
+    @_mutation
     def transfer_fuel(self, source_id: str, target_id: str, liters: float) -> Tuple[bool, str]:
         """5.6 Перекачка топлива между цистернами"""
-        source = next((c for c in self.cisterns if c.id == source_id), None)
-        target = next((c for c in self.cisterns if c.id == target_id), None)
+        error = _check_liters(liters)
+        if error:
+            return False, error
+        
+        source = self._cisterns_by_id.get(source_id)
+        target = self._cisterns_by_id.get(target_id)
         
         if not source or not target:
             return False, "Одна из цистерн не найдена"
@@ -176,15 +332,16 @@ class AZSOperations:
         self._add_operation(
             "transfer",
             f"Перекачка {liters} л {source.fuel_type} из {source_id} в {target_id}",
-            {"source_id": source_id, "target_id": target_id, "liters": liters, "fuel_type": source.fuel_type}
+            TransferDetails(source_id, target_id, liters, source.fuel_type)
         )
         
-        self.save_all()
+        self._save()
         return True, f"Успешно перекачано {liters} л из {source_id} в {target_id}"
     
+    @_mutation
     def toggle_cistern(self, cistern_id: str, enable: bool) -> Tuple[bool, str]:
         """5.7 Включение/выключение цистерн"""
-        cistern = next((c for c in self.cisterns if c.id == cistern_id), None)
+        cistern = self._cisterns_by_id.get(cistern_id)
         
         if not cistern:
             return False, "Цистерна не найдена"
@@ -201,12 +358,13 @@ class AZSOperations:
         self._add_operation(
             "toggle_cistern",
             f"Ручное управление: цистерна {cistern_id} {action}",
-            {"cistern_id": cistern_id, "action": "enable" if enable else "disable"}
+            ToggleCisternDetails(cistern_id, "enable" if enable else "disable")
         )
         
-        self.save_all()
+        self._save()
         return True, f"Цистерна {cistern_id} успешно {action}"
     
+    @_mutation
     def trigger_emergency(self) -> Tuple[bool, str]:
         """5.9 Аварийная ситуация"""
         self.emergency_mode = True
@@ -219,12 +377,13 @@ class AZSOperations:
         self._add_operation(
             "emergency",
             "АКТИВИРОВАН АВАРИЙНЫЙ РЕЖИМ! Все системы заблокированы.",
-            {"action": "emergency_activated"}
+            EmergencyDetails("emergency_activated")
         )
         
-        self.save_all()
+        self._save()
         return True, "АВАРИЙНЫЙ РЕЖИМ! Все цистерны заблокированы. Вызваны аварийные службы."
     
+    @_mutation
     def disable_emergency(self) -> Tuple[bool, str]:
         """Отключение аварийного режима"""
         self.emergency_mode = False
@@ -232,16 +391,17 @@ class AZSOperations:
         self._add_operation(
             "emergency",
             "Аварийный режим отключен",
-            {"action": "emergency_disabled"}
+            EmergencyDetails("emergency_disabled")
         )
         
-        self.save_all()
+        self._save()
         return True, "Аварийный режим отключен. Цистерны остаются заблокированными."
     
-    def get_cistern_status(self) -> List[str]:
+    def get_cistern_status(self, snapshot: Optional[StationSnapshot] = None) -> List[str]:
         """5.2 Получение статуса цистерн"""
+        snapshot = snapshot or self._snapshot
         status = []
-        for cistern in self.cisterns:
+        for cistern in snapshot.cisterns:
             status_str = f"{cistern.id} | {cistern.current_volume:,.0f} / {cistern.max_volume:,.0f} л | "
             status_str += "ВКЛ" if cistern.is_active else "ВЫКЛ"
             
@@ -251,13 +411,15 @@ class AZSOperations:
             status.append(status_str)
         return status
     
-    def get_column_status(self) -> List[str]:
+    def get_column_status(self, snapshot: Optional[StationSnapshot] = None) -> List[str]:
         """5.8 Получение статуса колонок"""
+        snapshot = snapshot or self._snapshot
+        cisterns = {c.id: c for c in snapshot.cisterns}
         status = []
-        for column in self.columns:
+        for column in snapshot.columns:
             fuels_info = []
             for fuel_type, cistern_id in column.available_fuels.items():
-                cistern = next((c for c in self.cisterns if c.id == cistern_id), None)
+                cistern = cisterns.get(cistern_id)
                 if cistern and cistern.is_active:
                     fuels_info.append(f"{fuel_type} ({cistern_id})")
                 else:
@@ -267,19 +429,30 @@ class AZSOperations:
             status.append(status_str)
         return status
     
-    def get_statistics(self) -> Dict:
+    def get_statistics(self, snapshot: Optional[StationSnapshot] = None) -> Dict:
         """5.4 Получение статистики"""
+        snapshot = snapshot or self._snapshot
         return {
-            "total_cars": self.stats.total_cars_served,
-            "total_income": self.stats.total_income,
-            "fuel_stats": self.stats.fuel_stats
+            "total_cars": snapshot.stats.total_cars_served,
+            "total_income": snapshot.stats.total_income,
+            "fuel_stats": snapshot.stats.fuel_stats
         }
     
-    def get_history(self, limit: int = 10) -> List[Operation]:
+    def reconcile(self) -> List[str]:
+        """Сверка сохранённого состояния с журналом операций"""
+        # Сверка читает файлы, поэтому отложенные данные пакета сохраняются заранее
+        if self._batch_depth:
+            self.flush()
+        return Reconciler(self.storage).run(save_checkpoint=False)
+    
+    def get_history(self, limit: int = 10, snapshot: Optional[StationSnapshot] = None) -> List[Operation]:
         """5.5 Получение истории операций"""
-        return self.history[-limit:] if limit > 0 else self.history
+        snapshot = snapshot or self._snapshot
+        size = snapshot.history_size
+        start = max(size - limit, 0) if limit > 0 else 0
+        return snapshot.history[start:size]
     
-    def _add_operation(self, op_type: str, description: str, details: Dict):
+    def _add_operation(self, op_type: str, description: str, details: OperationDetails):
         """Добавление операции в историю"""
         operation = Operation(
             id=self.next_op_id,
@@ -288,6 +461,7 @@ class AZSOperations:
             description=description,
             details=details
         )
-        self.storage.add_operation(operation)
         self.history.append(operation)
+        if not self._batch_depth:
+            self._save_logs()
         self.next_op_id += 1
\ No newline at end of file
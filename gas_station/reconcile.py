@@ -0,0 +1,205 @@
+"""
+Сверка состояния АЗС с журналом операций
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple
+from models import Operation, Transaction
+from storage import Storage
+
+# Начиная с этого числа записей свёртка журнала выполняется в нескольких процессах
+PARALLEL_THRESHOLD = 50000
+
+# Допустимая погрешность при сравнении объёмов и сумм: суммы из разных процессов
+# и от контрольной точки складываются в другом порядке, чем в stats.json
+REL_TOLERANCE = 1e-9
+ABS_TOLERANCE = 1e-6
+
+
+def _differs(a: float, b: float) -> bool:
+    return not math.isclose(a, b, rel_tol=REL_TOLERANCE, abs_tol=ABS_TOLERANCE)
+
+
+def _empty_stats() -> Dict:
+    return {"total_cars_served": 0, "total_income": 0.0, "fuel_stats": {}}
+
+
+def _fold_history(operations: List[Operation], routes: Dict[Tuple[int, str], str]) -> Dict[str, float]:
+    """Изменения объёмов цистерн по части журнала операций"""
+    deltas = {}
+    for op in operations:
+        details = op.details
+        op_type = op.operation_type
+        if op_type == "sale":
+            cistern_id = details.cistern_id
+            if cistern_id is None:
+                # Старые записи хранят только колонку, цистерна определяется по текущей схеме колонок
+                cistern_id = routes.get((details.column_id, details.fuel_type))
+            if cistern_id is not None:
+                deltas[cistern_id] = deltas.get(cistern_id, 0) - details.liters
+        elif op_type == "refuel":
+            cistern_id = details.cistern_id
+            deltas[cistern_id] = deltas.get(cistern_id, 0) + details.liters
+        elif op_type == "transfer":
+            source_id, target_id = details.source_id, details.target_id
+            deltas[source_id] = deltas.get(source_id, 0) - details.liters
+            deltas[target_id] = deltas.get(target_id, 0) + details.liters
+    return deltas
+
+
+def _fold_transactions(transactions: List[Transaction]) -> Dict:
+    """Приращение статистики по части списка транзакций"""
+    stats = _empty_stats()
+    for t in transactions:
+        stats["total_cars_served"] += 1
+        stats["total_income"] += t.total_price
+        fuel = stats["fuel_stats"].setdefault(t.fuel_type, {"liters": 0, "income": 0})
+        fuel["liters"] += t.liters
+        fuel["income"] += t.total_price
+    return stats
+
+
+def _fold_partition(args) -> Tuple[Dict[str, float], Dict]:
+    operations, transactions, routes = args
+    return _fold_history(operations, routes), _fold_transactions(transactions)
+
+
+def _partition(items: List, parts: int) -> List[List]:
+    """Разбиение упорядоченного по времени списка на последовательные интервалы"""
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)] if items else []
+
+
+class Reconciler:
+    """Восстановление объёмов цистерн и статистики по журналу операций"""
+
+    def __init__(self, storage: Storage, workers: int = None):
+        self.storage = storage
+        self.workers = workers or os.cpu_count() or 1
+        self.checkpoint_file = os.path.join(storage.data_dir, "checkpoint.json")
+
+    def _load_checkpoint(self) -> Dict:
+        """Последняя контрольная точка или начальное состояние станции"""
+        if os.path.exists(self.checkpoint_file):
+            return self.storage._load_data(self.checkpoint_file)
+        return {
+            "last_op_id": 0,
+            "last_transaction_id": 0,
+            "volumes": {c["id"]: c["current_volume"] for c in self.storage._get_default_cisterns()},
+            "stats": self.storage._get_default_stats()
+        }
+
+    def _fold(self, operations: List[Operation], transactions: List[Transaction],
+              routes: Dict[Tuple[int, str], str]) -> Tuple[Dict[str, float], Dict]:
+        """Свёртка журнала, для больших журналов — по интервалам времени в отдельных процессах"""
+        if len(operations) + len(transactions) < PARALLEL_THRESHOLD or self.workers < 2:
+            return _fold_partition((operations, transactions, routes))
+
+        op_parts = _partition(operations, self.workers)
+        tr_parts = _partition(transactions, self.workers)
+        op_parts += [[]] * (len(tr_parts) - len(op_parts))
+        tr_parts += [[]] * (len(op_parts) - len(tr_parts))
+        tasks = [(ops, trs, routes) for ops, trs in zip(op_parts, tr_parts)]
+
+        deltas, stats = {}, _empty_stats()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for part_deltas, part_stats in executor.map(_fold_partition, tasks):
+                for cistern_id, delta in part_deltas.items():
+                    deltas[cistern_id] = deltas.get(cistern_id, 0) + delta
+                self._merge_stats(stats, part_stats)
+        return deltas, stats
+
+    @staticmethod
+    def _merge_stats(target: Dict, part: Dict):
+        target["total_cars_served"] += part["total_cars_served"]
+        target["total_income"] += part["total_income"]
+        for fuel_type, data in part["fuel_stats"].items():
+            fuel = target["fuel_stats"].setdefault(fuel_type, {"liters": 0, "income": 0})
+            fuel["liters"] += data["liters"]
+            fuel["income"] += data["income"]
+
+    def run(self, save_checkpoint: bool = True) -> List[str]:
+        """Сверка сохранённого состояния с журналом, возвращает список расхождений.
+
+        При save_checkpoint=False файлы не изменяются (отчёт только для чтения).
+        """
+        checkpoint = self._load_checkpoint()
+
+        routes = {}
+        for column in self.storage.load_columns():
+            for fuel_type, cistern_id in column.available_fuels.items():
+                routes[(column.id, fuel_type)] = cistern_id
+
+        # Только записи после контрольной точки
+        operations = [op for op in self.storage.load_history() if op.id > checkpoint["last_op_id"]]
+        transactions = [t for t in self.storage.load_transactions()
+                        if t.id > checkpoint["last_transaction_id"]]
+
+        deltas, stats_delta = self._fold(operations, transactions, routes)
+
+        volumes = dict(checkpoint["volumes"])
+        # Цистерны, добавленные в конфигурацию позже, начинают с начального объёма
+        for cistern in self.storage._get_default_cisterns():
+            volumes.setdefault(cistern["id"], cistern["current_volume"])
+        for cistern_id, delta in deltas.items():
+            volumes[cistern_id] = volumes.get(cistern_id, 0) + delta
+        stats = checkpoint["stats"]
+        self._merge_stats(stats, stats_delta)
+
+        # Новая контрольная точка строится только по журналу
+        if save_checkpoint:
+            self.storage._save_data(self.checkpoint_file, {
+                "last_op_id": operations[-1].id if operations else checkpoint["last_op_id"],
+                "last_transaction_id": transactions[-1].id if transactions else checkpoint["last_transaction_id"],
+                "volumes": volumes,
+                "stats": stats
+            })
+
+        return self._compare(volumes, stats)
+
+    def _compare(self, volumes: Dict[str, float], stats: Dict) -> List[str]:
+        """Сравнение восстановленного состояния с cisterns.json и stats.json"""
+        discrepancies = []
+
+        for cistern in self.storage.load_cisterns():
+            expected = volumes.get(cistern.id)
+            if expected is None:
+                discrepancies.append(f"Цистерна {cistern.id}: нет в журнале")
+            elif _differs(expected, cistern.current_volume):
+                discrepancies.append(
+                    f"Цистерна {cistern.id}: по журналу {expected:.1f} л, сохранено {cistern.current_volume:.1f} л"
+                )
+
+        saved = self.storage.load_statistics()
+        if saved.total_cars_served != stats["total_cars_served"]:
+            discrepancies.append(
+                f"Обслужено автомобилей: по журналу {stats['total_cars_served']}, сохранено {saved.total_cars_served}"
+            )
+        if _differs(saved.total_income, stats["total_income"]):
+            discrepancies.append(
+                f"Общий доход: по журналу {stats['total_income']:.2f} ₽, сохранено {saved.total_income:.2f} ₽"
+            )
+        empty = {"liters": 0, "income": 0}
+        # Топливо, которое есть только в stats.json, тоже расхождение
+        for fuel_type in dict.fromkeys([*stats["fuel_stats"], *saved.fuel_stats]):
+            data = stats["fuel_stats"].get(fuel_type, empty)
+            saved_fuel = saved.fuel_stats.get(fuel_type, empty)
+            if (_differs(saved_fuel["liters"], data["liters"])
+                    or _differs(saved_fuel["income"], data["income"])):
+                discrepancies.append(
+                    f"{fuel_type}: по журналу {data['liters']} л ({data['income']:.2f} ₽), "
+                    f"сохранено {saved_fuel['liters']} л ({saved_fuel['income']:.2f} ₽)"
+                )
+
+        return discrepancies
+
+
+if __name__ == "__main__":
+    report = Reconciler(Storage()).run()
+    if report:
+        print("Обнаружены расхождения:")
+        for line in report:
+            print(f" - {line}")
+    else:
+        print("Состояние совпадает с журналом операций")
@@ -3,12 +3,15 @@
 """
 import json
 import os
+import textwrap
 from typing import List, Dict, Any
 from models import Cistern, Column, Statistics, Operation, Transaction
+from config import StationConfig, load_config
 
 class Storage:
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", config: StationConfig = None):
         self.data_dir = data_dir
+        self.config = config or load_config()
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
         
@@ -38,92 +41,21 @@ class Storage:
     
     def _get_default_cisterns(self):
         """Создание начальных цистерн (Раздел 2.2)"""
-        return [
-            {
-                "id": "АИ-92 №1",
-                "fuel_type": "АИ-92",
-                "max_volume": 20000,
-                "current_volume": 12400,
-                "min_level": 1000,
-                "is_active": True
-            },
-            {
-                "id": "АИ-95 №1",
-                "fuel_type": "АИ-95",
-                "max_volume": 20000,
-                "current_volume": 9800,
-                "min_level": 1000,
-                "is_active": True
-            },
-            {
-                "id": "АИ-95 №2",
-                "fuel_type": "АИ-95",
-                "max_volume": 20000,
-                "current_volume": 1200,
-                "min_level": 1000,
-                "is_active": False
-            },
-            {
-                "id": "АИ-98 №1",
-                "fuel_type": "АИ-98",
-                "max_volume": 15000,
-                "current_volume": 10000,
-                "min_level": 800,
-                "is_active": False
-            },
-            {
-                "id": "ДТ №1",
-                "fuel_type": "ДТ",
-                "max_volume": 25000,
-                "current_volume": 15600,
-                "min_level": 1200,
-                "is_active": True
-            }
-        ]
+        return [dict(cistern) for cistern in self.config.cisterns]
     
     def _get_default_columns(self):
         """Создание начальных колонок (Раздел 3.1, 3.2)"""
-        columns = []
-        for i in range(1, 9):
-            fuels = {}
-            
-            # АИ-95
-            if i <= 4:
-                fuels["АИ-95"] = "АИ-95 №1"
-            elif i >= 5:
-                fuels["АИ-95"] = "АИ-95 №2"
-            
-            # АИ-92
-            if i <= 6:
-                fuels["АИ-92"] = "АИ-92 №1"
-            
-            # АИ-98
-            if 3 <= i <= 6:
-                fuels["АИ-98"] = "АИ-98 №1"
-            
-            # ДТ
-            if 3 <= i <= 8:
-                fuels["ДТ"] = "ДТ №1"
-            
-            columns.append({
-                "id": i,
-                "available_fuels": fuels,
-                "is_active": True
-            })
-        
-        return columns
+        return [
+            {"id": c["id"], "available_fuels": dict(c["available_fuels"]), "is_active": c["is_active"]}
+            for c in self.config.columns
+        ]
     
     def _get_default_stats(self):
         """Начальная статистика"""
         return {
             "total_cars_served": 0,
             "total_income": 0.0,
-            "fuel_stats": {
-                "АИ-92": {"liters": 0, "income": 0},
-                "АИ-95": {"liters": 0, "income": 0},
-                "АИ-98": {"liters": 0, "income": 0},
-                "ДТ": {"liters": 0, "income": 0}
-            }
+            "fuel_stats": {fuel_type: {"liters": 0, "income": 0} for fuel_type in self.config.fuel_prices}
         }
     
     def _load_data(self, file_path):
@@ -188,14 +120,46 @@ class Storage:
         data = [t.to_dict() for t in transactions]
         self._save_data(self.transactions_file, data)
     
+    def _append_data(self, file_path, items: List[Dict]):
+        """Дописывание элементов в конец JSON-массива без перезаписи всего файла"""
+        if not items:
+            return
+        chunk = ",\n".join(
+            textwrap.indent(json.dumps(item, ensure_ascii=False, indent=2), "  ") for item in items
+        )
+        try:
+            with open(file_path, 'rb+') as f:
+                # Ищем закрывающую скобку массива в конце файла
+                size = f.seek(0, os.SEEK_END)
+                tail_start = max(size - 64, 0)
+                f.seek(tail_start)
+                tail = f.read()
+                end = tail.rfind(b"]")
+                if end >= 0:
+                    head = tail[:end].rstrip()
+                    f.seek(tail_start + len(head))
+                    f.truncate()
+                    separator = "\n" if head.endswith(b"[") else ",\n"
+                    f.write((separator + chunk + "\n]").encode('utf-8'))
+                    return
+        except FileNotFoundError:
+            pass
+        # Файла нет или он повреждён — записываем массив целиком
+        data = self._load_data(file_path) + items
+        self._save_data(file_path, data)
+    
+    def append_operations(self, operations: List[Operation]):
+        """Добавление операций в конец истории"""
+        self._append_data(self.history_file, [op.to_dict() for op in operations])
+    
+    def append_transactions(self, transactions: List[Transaction]):
+        """Добавление транзакций в конец списка"""
+        self._append_data(self.transactions_file, [t.to_dict() for t in transactions])
+    
     def add_operation(self, operation: Operation):
         """Добавление операции в историю"""
-        history = self.load_history()
-        history.append(operation)
-        self.save_history(history)
+        self.append_operations([operation])
     
     def add_transaction(self, transaction: Transaction):
         """Добавление транзакции"""
-        transactions = self.load_transactions()
-        transactions.append(transaction)
-        self.save_transactions(transactions)
\ No newline at end of file
+        self.append_transactions([transaction])
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Прогон лабораторных на наборах входных данных: сверка вывода с эталоном, время работы и пиковая память.
+
+Наборы лежат в fixtures/<лабораторная>/<скрипт>/, например fixtures/lab6/задание 4/.
+Один тест — файлы с общим именем:
+
+    01.in      стандартный ввод (если файла нет, ввод пустой)
+    01.args    аргументы командной строки в одну строку
+    01.gen.py  генератор ввода вместо .in: печатает большой ввод для замера скорости
+    01.out     эталонный вывод
+    01.code    ожидаемый код возврата, если не 0 (тест на ошибку во вводе)
+
+Тесты с именем на perf (perf.gen.py, perf.args) только замеряются: их вывод
+велик или зависит от времени, эталон для них не пишется.
+
+Скрипт запускается в каталоге теста, так что файлы из .args ищутся рядом с тестом.
+
+    python bench.py                       # все тесты
+    python bench.py lab5 "lab6/задание 4"  # только эти лабораторные или скрипты
+    python bench.py --repeat 3 --save before.json
+    python bench.py --baseline before.json
+    python bench.py --update               # переписать эталоны по текущему выводу
+"""
+import argparse
+import filecmp
+import glob
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource  # пиковая память дочернего процесса, есть только на Unix
+except ImportError:
+    resource = None
+
+LABS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(LABS_DIR, "fixtures")
+INPUT_SUFFIXES = (".in", ".args", ".gen.py")
+
+
+def run(command, input_path, output_path, error_path, cwd=None):
+    """Один запуск в отдельном процессе: (код возврата, секунды, пиковая память в КБ).
+
+    Вывод пишется в файл, а не читается сюда: память этого процесса
+    на момент запуска попала бы в ru_maxrss дочернего.
+    """
+    env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONHASHSEED="0")
+    with open(input_path, "rb") as stdin, open(output_path, "wb") as stdout, open(error_path, "wb") as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdin=stdin, stdout=stdout, stderr=stderr, cwd=cwd, env=env)
+        if resource is not None and hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            peak = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss  # на macOS — в байтах
+        else:
+            process.wait()
+            peak = None
+        elapsed = time.perf_counter() - start
+    return process.returncode, elapsed, peak
+
+
+def find_cases(selected=()):
+    """Тесты в виде (имя, скрипт, каталог, имя теста), отобранные по префиксам selected"""
+    cases = []
+    for directory in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*", "*"))):
+        lab, script = os.path.relpath(directory, FIXTURES_DIR).split(os.sep)
+        key = f"{lab}/{script}"
+        if selected and not any(key == s or key.startswith(s.rstrip("/") + "/") for s in selected):
+            continue
+        names = sorted({entry[:-len(suffix)] for entry in os.listdir(directory)
+                        for suffix in INPUT_SUFFIXES if entry.endswith(suffix)})
+        script_path = os.path.join(LABS_DIR, lab, script + ".py")
+        cases.extend((f"{key}/{name}", script_path, directory, name) for name in names)
+    return cases
+
+
+def scripts_without_fixtures():
+    covered = {os.path.relpath(d, FIXTURES_DIR) for d in glob.glob(os.path.join(FIXTURES_DIR, "*", "*"))}
+    scripts = glob.glob(os.path.join(LABS_DIR, "lab*", "*.py"))
+    return sorted(path for path in (os.path.relpath(s, LABS_DIR)[:-3] for s in scripts) if path not in covered)
+
+
+def expected_code(base):
+    if os.path.exists(base + ".code"):
+        with open(base + ".code", encoding="utf-8") as f:
+            return int(f.read())
+    return 0
+
+
+def run_case(script_path, directory, name, work_dir, repeat):
+    """Прогон одного теста repeat раз: (код, лучшее время, пиковая память, файл вывода, файл ошибок)"""
+    base = os.path.join(directory, name)
+    command = [sys.executable, script_path]
+    if os.path.exists(base + ".args"):
+        with open(base + ".args", encoding="utf-8") as f:
+            command += shlex.split(f.read())
+
+    input_path = base + ".in" if os.path.exists(base + ".in") else os.devnull
+    if os.path.exists(base + ".gen.py"):
+        # Ввод генерируется заранее, в замер попадает только сам скрипт
+        input_path = os.path.join(work_dir, "input")
+        with open(input_path, "wb") as f:
+            subprocess.run([sys.executable, base + ".gen.py"], stdout=f, cwd=directory, check=True)
+
+    output_path = os.path.join(work_dir, "output")
+    error_path = os.path.join(work_dir, "errors")
+    times, peaks = [], []
+    for _ in range(repeat):
+        code, elapsed, peak = run(command, input_path, output_path, error_path, cwd=directory)
+        times.append(elapsed)
+        if peak is not None:
+            peaks.append(peak)
+    return code, min(times), max(peaks) if peaks else None, output_path, error_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сверка вывода, время и память лабораторных")
+    parser.add_argument("selected", nargs="*", help="лабораторные или скрипты, например lab5 или \"lab6/задание 4\"")
+    parser.add_argument("--repeat", type=int, default=1, help="запусков на каждый тест, выводится лучшее время")
+    parser.add_argument("--update", action="store_true", help="записать текущий вывод как эталонный")
+    parser.add_argument("--save", help="сохранить время и память в JSON для сравнения позже")
+    parser.add_argument("--baseline", help="JSON из --save предыдущего прогона для сравнения")
+    args = parser.parse_args()
+    if args.repeat <= 0:
+        parser.error("--repeat должно быть положительным")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    cases = find_cases(args.selected)
+    if not cases:
+        parser.error("тесты не найдены")
+
+    results, failed = {}, 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        for key, script_path, directory, name in cases:
+            code, elapsed, peak, output_path, error_path = run_case(script_path, directory, name,
+                                                                    work_dir, args.repeat)
+            results[key] = {"time": elapsed, "memory": peak}
+
+            memory = f"{peak / 1024:.1f} МБ" if peak is not None else "н/д"
+            line = f"{key}: {elapsed:.3f} с, память {memory}"
+            if key in baseline:
+                line += f" (было {baseline[key]['time']:.3f} с)"
+            base = os.path.join(directory, name)
+            if code:
+                line += f", код {code}"
+            if args.update:
+                if code:
+                    with open(base + ".code", "w", encoding="utf-8") as f:
+                        f.write(f"{code}\n")
+                elif os.path.exists(base + ".code"):
+                    os.remove(base + ".code")
+            elif code != expected_code(base):
+                line += f" (ожидался {expected_code(base)}), КОД ВОЗВРАТА ОТЛИЧАЕТСЯ"
+                failed += 1
+
+            expected = base + ".out"
+            timing_only = name.startswith("perf")
+            if args.update and not timing_only:
+                shutil.copyfile(output_path, expected)
+                line += ", эталон записан"
+            elif os.path.exists(expected):
+                if filecmp.cmp(output_path, expected, shallow=False):
+                    line += ", вывод совпадает"
+                else:
+                    line += ", ВЫВОД ОТЛИЧАЕТСЯ"
+                    failed += 1
+            elif not timing_only:
+                line += ", нет эталона"
+            print(line)
+            if code and os.path.getsize(error_path):
+                with open(error_path, encoding="utf-8", errors="replace") as f:
+                    print("    " + f.read().strip().splitlines()[-1])
+
+    if not args.selected:
+        for path in scripts_without_fixtures():
+            print(f"{path}: нет тестов")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Тестов: {len(cases)}, расхождений: {failed}")
+    sys.exit(1 if failed else 0)
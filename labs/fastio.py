@@ -0,0 +1,121 @@
+"""
+Быстрое чтение ввода для лабораторных работ.
+
+С клавиатуры строки читаются через input(), как раньше. Если ввод
+перенаправлен из файла или канала, строки берутся из буферизованного
+sys.stdin.buffer без текстового слоя: readline() возвращает строку, как
+только она пришла, поэтому программа, работающая через канал, отвечает
+сразу, а не после конца ввода. Подсказки печатаются так же, как их печатает input().
+"""
+import re
+import sys
+import warnings
+from array import array
+
+try:
+    import numpy as np  # быстрый разбор длинных строк чисел, если numpy установлен
+except ImportError:
+    np = None
+
+INT64_LIMITS = (-2 ** 63, 2 ** 63 - 1)  # numpy упирается в эти значения при переполнении
+# Знак без цифр: numpy приклеивает его к следующему числу ("7 - 3" -> 7, -3) или читает как 0
+LONE_SIGN = re.compile(r"(?<!\S)[+-](?!\S)").search
+
+
+class Reader:
+    """Построчное чтение из потока с разбором чисел"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.interactive = self.stream.isatty()
+        self.encoding = self.stream.encoding or "utf-8"
+
+    def readline(self) -> str:
+        """Следующая строка вместе с переводом строки, "" в конце ввода (как у файлов)"""
+        if self.interactive:
+            return self.stream.readline()
+        return self.stream.buffer.readline().decode(self.encoding)
+
+    def line(self, prompt: str = "") -> str:
+        """Аналог input(prompt): строка без перевода строки, EOFError в конце ввода"""
+        if self.interactive:
+            return input(prompt)
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+        line = self.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line[:-1] if line.endswith("\n") else line
+
+    def ints(self, prompt: str = "") -> list:
+        """Целые числа из следующей строки; ValueError, как у int(), если там не только числа"""
+        return parse_ints(self.line(prompt))
+
+    def floats(self, prompt: str = "") -> list:
+        return parse_floats(self.line(prompt))
+
+
+def _parse_int64(line: str):
+    """numpy-массив int64 или None, если строку нужно разбирать через int()"""
+    if np is None:
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            values = np.fromstring(line, dtype=np.int64, sep=" ")
+    except (ValueError, DeprecationWarning):
+        return None  # нестандартная запись — разбираем обычным int(), он и сообщит об ошибке
+    if len(values) != len(line.split()) or LONE_SIGN(line):
+        return None  # numpy разобрал не так, как int() по словам
+    if len(values) and (values.min() <= INT64_LIMITS[0] or values.max() >= INT64_LIMITS[1]):
+        return None  # возможно переполнение
+    return values
+
+
+def parse_ints(line: str) -> list:
+    """Список целых из строки, разделённых пробельными символами"""
+    if len(line) > 1000:
+        values = _parse_int64(line)
+        if values is not None:
+            return values.tolist()
+    return list(map(int, line.split()))
+
+
+def parse_int64(line: str):
+    """Целые из строки в array('q'), а если какое-то не помещается в int64 — в списке int"""
+    values = _parse_int64(line)
+    if values is not None:
+        return array('q', values.tobytes())
+    values = list(map(int, line.split()))
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values
+
+
+def parse_floats(line: str) -> list:
+    return list(map(float, line.split()))
+
+
+_stdin = None
+
+
+def stdin() -> Reader:
+    """Общий Reader для sys.stdin"""
+    global _stdin
+    if _stdin is None:
+        _stdin = Reader()
+    return _stdin
+
+
+def line(prompt: str = "") -> str:
+    return stdin().line(prompt)
+
+
+def ints(prompt: str = "") -> list:
+    return stdin().ints(prompt)
+
+
+def floats(prompt: str = "") -> list:
+    return stdin().floats(prompt)
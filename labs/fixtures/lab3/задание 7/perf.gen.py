@@ -0,0 +1,3 @@
+import random
+rng = random.Random(7)
+print("".join(rng.choice("абвгдеёжзabcdef ") for _ in range(2_000_000)))
@@ -0,0 +1,6 @@
+import random
+rng = random.Random(10)
+print(20000)
+for i in range(20000):
+    print(f"студент{i}")
+    print(" ".join(str(rng.randint(2, 5)) for _ in range(50)))
@@ -0,0 +1,3 @@
+import random
+rng = random.Random(4)
+print(" ".join(str(rng.randint(-10**9, 10**9)) if i % 3 else f"{rng.uniform(-1e6, 1e6):.3f}" for i in range(300_000)))
@@ -0,0 +1,6 @@
+import random
+rng = random.Random(6)
+n = 700
+print(n)
+for _ in range(2 * n):
+    print(" ".join(str(rng.randint(-10**6, 10**6)) for _ in range(n)))
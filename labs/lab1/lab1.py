@@ -29,7 +29,7 @@ print("Задание 5")
 length = float(input("Введите длину прямоугольника: "))
 width = float(input("Введите ширину прямоугольник: "))
 area = width*length
-perimeter = 2 * (lenght + width)
+perimeter = 2 * (length + width)
 print(f"Площадь пряиоугольника: {area}")
 print(f"Периметр прямоугольника: {perimeter}")
 
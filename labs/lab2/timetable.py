@@ -0,0 +1,235 @@
+"""
+Разбор расписаний timetable_*.md и поиск по ним
+"""
+import argparse
+import glob
+import os
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+
+WEEKDAYS = ["понедельник", "вторник", "среда", "четверг", "пятница", "суббота", "воскресенье"]
+
+# «Понедельник (29.09.2025):», «среда (01.10.25)», «четверг(02.10.25)»
+DAY_PATTERN = re.compile(
+    r"^\s*(" + "|".join(WEEKDAYS) + r")\s*\((\d{1,2})\.(\d{1,2})\.(\d{2}|\d{4})\)\s*:?\s*$",
+    re.IGNORECASE
+)
+TIME_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$")
+SEPARATOR_PATTERN = re.compile(r"^[\s|:-]+$")
+
+
+@dataclass(slots=True)
+class Lesson:
+    """Одна пара; время — в минутах от начала суток"""
+    day: date
+    start: int
+    end: int
+    discipline: str
+    room: str
+    source: str
+
+    @property
+    def rooms(self):
+        """Отдельные аудитории из ячейки вроде «233, СК Чемпион»"""
+        return [room for room in (part.strip() for part in self.room.split(",")) if room]
+
+    @property
+    def weekday(self) -> str:
+        return WEEKDAYS[self.day.weekday()]
+
+    def __str__(self):
+        return (f"{self.day:%d.%m.%Y} {format_time(self.start)}-{format_time(self.end)} "
+                f"{self.discipline} ({self.room or 'аудитория не указана'})")
+
+
+def format_time(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_file(path: str):
+    """Пары из одного файла расписания.
+
+    Строка таблицы с пустым временем продолжает предыдущую пару: её текст
+    дописывается к дисциплине, а непустые ячейки правее — к аудитории
+    (в части файлов номер аудитории съехал в лишнюю ячейку).
+    """
+    lessons = []
+    day = None
+    current = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = DAY_PATTERN.match(line)
+            if match:
+                day_of_month, month, year = int(match[2]), int(match[3]), int(match[4])
+                day = date(year + 2000 if year < 100 else year, month, day_of_month)
+                current = None
+                continue
+
+            line = line.strip()
+            if not line.startswith("|") or SEPARATOR_PATTERN.match(line) or day is None:
+                continue
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            while len(cells) < 3:
+                cells.append("")
+            time, discipline, rooms = cells[0], cells[1], [cell for cell in cells[2:] if cell]
+
+            times = TIME_PATTERN.match(time)
+            if times:
+                start = int(times[1]) * 60 + int(times[2])
+                end = int(times[3]) * 60 + int(times[4])
+                current = Lesson(day, start, end, discipline, ", ".join(rooms), path)
+                lessons.append(current)
+            elif not time and current is not None:
+                if discipline:
+                    current.discipline = f"{current.discipline} {discipline}"
+                if rooms:
+                    current.room = ", ".join(filter(None, [current.room] + rooms))
+    return lessons
+
+
+class Timetable:
+    """Расписание из нескольких файлов с индексами по дням, аудиториям и дисциплинам"""
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        # Разобранные файлы: путь -> (время изменения, пары)
+        self._files = {}
+        self.lessons = []
+        self.by_day = {}
+        self.by_room = {}
+        self.by_discipline = {}
+        # Аудитория -> (начала пар, пары, максимум концов среди пар до текущей включительно)
+        self._intervals = {}
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Повторный разбор изменившихся файлов; True, если расписание изменилось"""
+        changed = False
+        for path in self.paths:
+            mtime = os.path.getmtime(path)
+            cached = self._files.get(path)
+            if not cached or cached[0] != mtime:
+                self._files[path] = (mtime, parse_file(path))
+                changed = True
+        for path in set(self._files) - set(self.paths):
+            del self._files[path]
+            changed = True
+        if changed:
+            self._build_indexes()
+        return changed
+
+    @staticmethod
+    def _moment(day: date, minutes: int) -> int:
+        """Абсолютное время в минутах, чтобы пары разных дней лежали на одной оси"""
+        return day.toordinal() * 1440 + minutes
+
+    def _build_indexes(self):
+        # Одна и та же пара может быть записана в нескольких файлах — оставляем первую запись
+        unique = {}
+        for path in self.paths:
+            for lesson in self._files[path][1]:
+                unique.setdefault((lesson.day, lesson.start, lesson.end, lesson.discipline, lesson.room), lesson)
+        self.lessons = sorted(unique.values(), key=lambda lesson: (lesson.day, lesson.start, lesson.end))
+        self.by_day, self.by_room, self.by_discipline = {}, {}, {}
+        for lesson in self.lessons:
+            self.by_day.setdefault(lesson.day, []).append(lesson)
+            self.by_discipline.setdefault(lesson.discipline.lower(), []).append(lesson)
+            for room in lesson.rooms:
+                self.by_room.setdefault(room, []).append(lesson)
+
+        self._intervals = {}
+        for room, lessons in self.by_room.items():
+            starts, max_ends, max_end = [], [], 0
+            for lesson in lessons:
+                starts.append(self._moment(lesson.day, lesson.start))
+                max_end = max(max_end, self._moment(lesson.day, lesson.end))
+                max_ends.append(max_end)
+            self._intervals[room] = (starts, lessons, max_ends)
+
+    def at(self, room: str, when: datetime):
+        """Пары в аудитории в заданный момент"""
+        if room not in self._intervals:
+            return []
+        starts, lessons, max_ends = self._intervals[room]
+        moment = self._moment(when.date(), when.hour * 60 + when.minute)
+        found = []
+        # Кандидаты — пары, начавшиеся не позже момента; идём назад, пока какая-то из них может его накрывать
+        i = bisect_right(starts, moment) - 1
+        while i >= 0 and max_ends[i] > moment:
+            if self._moment(lessons[i].day, lessons[i].end) > moment:
+                found.append(lessons[i])
+            i -= 1
+        found.reverse()
+        return found
+
+    def day(self, day: date):
+        return self.by_day.get(day, [])
+
+    def discipline(self, name: str):
+        return self.by_discipline.get(name.lower(), [])
+
+    def conflicts(self):
+        """Пересекающиеся по времени пары в одной аудитории: список (аудитория, пара, пара).
+
+        Пара с тем же временем и дисциплиной, записанная в разных файлах
+        с разным номером аудитории в одном корпусе, конфликтом не считается.
+        Пара пересечений, общих для нескольких аудиторий, выводится один раз.
+        """
+        found = []
+        seen = set()
+        for room, lessons in self.by_room.items():
+            active = []  # пары, ещё идущие к началу текущей
+            for lesson in lessons:
+                start = self._moment(lesson.day, lesson.start)
+                active = [other for other in active if self._moment(other.day, other.end) > start]
+                for other in active:
+                    if (other.start, other.end, other.discipline) == (lesson.start, lesson.end, lesson.discipline):
+                        continue
+                    if (id(other), id(lesson)) not in seen:
+                        seen.add((id(other), id(lesson)))
+                        found.append((room, other, lesson))
+                active.append(lesson)
+        return found
+
+
+def default_paths():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    return sorted(glob.glob(os.path.join(directory, "timetable_*.md")))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Поиск по расписанию")
+    parser.add_argument("files", nargs="*", help="файлы расписания (по умолчанию timetable_*.md рядом со скриптом)")
+    parser.add_argument("--day", help="пары за день, например 30.09.2025")
+    parser.add_argument("--room", help="аудитория, например 1530")
+    parser.add_argument("--at", help="момент для --room, например \"30.09.2025 10:30\"")
+    parser.add_argument("--discipline", help="все пары по дисциплине")
+    parser.add_argument("--conflicts", action="store_true", help="пересечения пар в одной аудитории")
+    args = parser.parse_args()
+
+    timetable = Timetable(args.files or default_paths())
+    if args.day:
+        lessons = timetable.day(datetime.strptime(args.day, "%d.%m.%Y").date())
+    elif args.room and args.at:
+        lessons = timetable.at(args.room, datetime.strptime(args.at, "%d.%m.%Y %H:%M"))
+    elif args.room:
+        lessons = timetable.by_room.get(args.room, [])
+    elif args.discipline:
+        lessons = timetable.discipline(args.discipline)
+    elif args.conflicts:
+        lessons = []
+        conflicts = timetable.conflicts()
+        for room, first, second in conflicts:
+            print(f"{room}: {first} [{os.path.basename(first.source)}] / "
+                  f"{second} [{os.path.basename(second.source)}]")
+        if not conflicts:
+            print("Пересечений нет")
+    else:
+        lessons = timetable.lessons
+
+    for lesson in lessons:
+        print(f"{lesson.weekday.capitalize()} {lesson}")
+    if not lessons and not args.conflicts:
+        print("Ничего не найдено")
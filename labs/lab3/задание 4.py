@@ -1,5 +1,20 @@
+import sys
+
+if hasattr(sys, "set_int_max_str_digits"):  # в Python до 3.10.7 нет ни предела, ни этой функции
+    sys.set_int_max_str_digits(0)  # факториалы больших чисел длиннее стандартного предела в 4300 цифр
+
+
+def range_product(lo, hi):
+    """Произведение чисел от lo до hi: дерево произведений вместо умножения по одному"""
+    if hi - lo < 16:
+        result = 1
+        for i in range(lo, hi + 1):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return range_product(lo, mid) * range_product(mid + 1, hi)
+
+
 number = int(input("Введите число для вычисления факториала: "))
-factorial = 1
-for i in range(1, number + 1):
-    factorial *= i
-print(f"Факториал числа {number} равен {factorial}")
\ No newline at end of file
+factorial = range_product(1, number)
+print(f"Факториал числа {number} равен {factorial}")
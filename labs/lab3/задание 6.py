@@ -1,10 +1,18 @@
+import sys
+
+if hasattr(sys, "set_int_max_str_digits"):  # в Python до 3.10.7 нет ни предела, ни этой функции
+    sys.set_int_max_str_digits(0)  # предел и числа могут быть длиннее 4300 цифр
+
+
+def fibonacci_up_to(limit):
+    """Числа Фибоначчи, не превосходящие limit, выдаются по одному"""
+    a, b = 0, 1
+    while a <= limit:
+        yield a
+        a, b = b, a + b
+
+
 limit = int(input("Введите предел для чисел Фибоначчи: "))
-a, b = 0, 1
 print("Числа Фибоначчи:")
-while a <= limit:
+for a in fibonacci_up_to(limit):
     print(a, end=" ")
-    # a, b = b, a + b
-    c = a
-    a = b
-    b = c + b 
-    
\ No newline at end of file
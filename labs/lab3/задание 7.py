@@ -1,5 +1,24 @@
-text = input("Введите строку: ")
-result = ""
-for i, char in enumerate(text, 1):
-    result += char + str(i)
-print(f"Результат: {result}")
\ No newline at end of file
+import sys
+
+CHUNK_SIZE = 1 << 16  # символов за одно чтение в потоковом режиме
+
+
+def interleave(chunks, start=1):
+    """Каждый символ с его номером; нумерация продолжается через границы кусков"""
+    position = start
+    for chunk in chunks:
+        numbers = map(str, range(position, position + len(chunk)))
+        yield "".join(map(str.__add__, chunk, numbers))
+        position += len(chunk)
+
+
+if len(sys.argv) > 1:
+    # Потоковый режим: python "задание 7.py" файл (или - для стандартного ввода)
+    source = sys.stdin if sys.argv[1] == "-" else open(sys.argv[1], encoding="utf-8")
+    with source:
+        for piece in interleave(iter(lambda: source.read(CHUNK_SIZE), "")):
+            sys.stdout.write(piece)
+else:
+    text = input("Введите строку: ")
+    result = "".join(interleave([text]))
+    print(f"Результат: {result}")
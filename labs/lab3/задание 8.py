@@ -1,6 +1,10 @@
 print("Программа для сложения двух чисел (для выхода нажмите Ctrl+C)")
 while True:
-    numbers_input = input("Введите 2 числа через пробел: ")
+    try:
+        numbers_input = input("Введите 2 числа через пробел: ")
+    except EOFError:
+        print("\nПрограмма завершенна.")
+        break
     try:
         num1, num2 = map(int, numbers_input.split())
         sum_result = num1 + num2
@@ -1,18 +1,154 @@
+import sys
+from functools import lru_cache
+from math import isqrt
+
+SMALL_LIMIT = 1 << 16  # до этого числа ответ берётся из таблицы
+
+# Битовая карта простых чисел < SMALL_LIMIT (решето Эратосфена)
+_small = bytearray([1]) * SMALL_LIMIT
+_small[:2] = b"\x00\x00"
+for _i in range(2, isqrt(SMALL_LIMIT - 1) + 1):
+    if _small[_i]:
+        _small[_i * _i::_i] = bytes((SMALL_LIMIT - 1 - _i * _i) // _i + 1)
+
+SMALL_PRIMES = [p for p in range(2, 100) if _small[p]]  # быстрый отсев составных
+
+# С этими основаниями тест Миллера — Рабина точен для всех n < 2^64
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _strong_probable_prime(n, d, s, a):
+    """Сильный тест Ферма (шаг Миллера — Рабина) по основанию a, n - 1 = d * 2^s"""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False  # a — свидетель составности
+
+
+def _jacobi(a, n):
+    """Символ Якоби (a/n) для нечётного n > 0"""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _half(x, n):
+    """x / 2 по модулю нечётного n"""
+    return (x + n if x % 2 else x) // 2 % n
+
+
+def _strong_lucas_probable_prime(n):
+    """Сильный тест Люка с параметрами Селфриджа (n нечётное, не делится на малые простые)"""
+    if isqrt(n) ** 2 == n:
+        return False  # для полного квадрата подходящего D не найдётся
+    D = 5
+    while _jacobi(D, n) != -1:
+        if _jacobi(D, n) == 0:
+            return False  # общий делитель |D| и n
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    d, s = n + 1, 0
+    while d % 2 == 0:  # n + 1 = d * 2^s, d нечётное
+        d //= 2
+        s += 1
+
+    # U_k, V_k, Q^k по модулю n; двоичный подъём от k = 1 до k = d
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V = _half(P * U + V, n), _half(D * U + P * V, n)
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+@lru_cache(maxsize=65536)  # повторные запросы не пересчитываются
 def is_prime(n):
-    if n < 2:
-        return False  # числа < 2 — не простые
-    for i in range(2, int(n**0.5) + 1):  # проверяем делители до корня n
-        if n % i == 0:
-            return False  # нашли делитель -> составное
-    return True  # делителей нет -> простое
-
-while True:
-    try:
-        num = int(input("Введите целое число: "))
-        if num >= 0:  # принимаются только неотрицательные числа
-            print("Простое" if is_prime(num) else "Составное")
-            break
-        # если num < 0 — цикл повторяется (но сообщение об ошибке не выводится)
-    except:
-        print("Ошибка: введите целое число.")
-# Замечание: при вводе отрицательного числа программа молча запрашивает снова
\ No newline at end of file
+    if n < SMALL_LIMIT:
+        return n >= 2 and _small[n] == 1  # числа < 2 — не простые
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return False  # нашли малый делитель -> составное
+    d, s = n - 1, 0
+    while d % 2 == 0:  # n - 1 = d * 2^s, d нечётное
+        d //= 2
+        s += 1
+    if n < 1 << 64:
+        return all(_strong_probable_prime(n, d, s, a) for a in MR_BASES)
+    # Для больших n фиксированного набора оснований не хватает (318665857834031151167461
+    # проходит все основания до 37), поэтому тест Бейли — PSW: основание 2 и сильный тест Люка.
+    # Ответ «простое» здесь означает вероятно простое (BPSW): контрпримеры неизвестны,
+    # но правильность теста не доказана
+    return _strong_probable_prime(n, d, s, 2) and _strong_lucas_probable_prime(n)
+
+
+def is_prime_many(numbers):
+    return [is_prime(n) for n in numbers]  # проверка списка чисел
+
+
+def self_check(limit=10 ** 7):
+    """Сверка is_prime с решетом Эратосфена для всех n < limit и с известными псевдопростыми"""
+    sieve = bytearray([1]) * limit
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes((limit - 1 - i * i) // i + 1)
+    for n in range(limit):
+        if is_prime.__wrapped__(n) != sieve[n]:
+            return f"расхождение с решетом для {n}"
+
+    composites = [
+        3215031751,  # сильное псевдопростое по основаниям 2, 3, 5, 7
+        3825123056546413051,  # по основаниям 2..23
+        318665857834031151167461,  # по основаниям 2..37
+        3317044064679887385961981,  # по основаниям 2..37
+        (2 ** 61 - 1) * (2 ** 89 - 1),
+        (2 ** 64 + 13) ** 2,
+    ]
+    primes = [2 ** 61 - 1, 2 ** 64 - 59, 2 ** 64 + 13, 2 ** 89 - 1, 2 ** 127 - 1, 2 ** 521 - 1]
+    for n in composites:
+        if is_prime(n):
+            return f"{n} составное, но признано простым"
+    for n in primes:
+        if not is_prime(n):
+            return f"{n} простое, но признано составным"
+    return None
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--check"]:
+        limit = int(sys.argv[2]) if len(sys.argv) > 2 else 10 ** 7
+        error = self_check(limit)
+        print(error or f"is_prime совпадает с решетом для n < {limit}")
+        sys.exit(1 if error else 0)
+
+    while True:
+        try:
+            num = int(input("Введите целое число: "))
+            if num >= 0:  # принимаются только неотрицательные числа
+                print("Простое" if is_prime(num) else "Составное")
+                break
+            # если num < 0 — цикл повторяется (но сообщение об ошибке не выводится)
+        except:
+            print("Ошибка: введите целое число.")
+    # Замечание: при вводе отрицательного числа программа молча запрашивает снова
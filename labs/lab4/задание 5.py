@@ -1,22 +1,104 @@
-password = input("Введите пароль: ")
-has_upper = any(c.isupper() for c in password)
-has_lower = any(c.islower() for c in password)
-has_digit = any(c.isdigit() for c in password)
-has_special = any(not c.isalnum() for c in password)
-
-errors = []
-if len(password) < 8:
-    errors.append("длина менее 8 символов")
-if not has_upper:
-    errors.append("нет заглавных букв")
-if not has_lower:
-    errors.append("нет строчных букв")
-if not has_digit:
-    errors.append("нет цифр")
-if not has_special:
-    errors.append("нет специальных символов")
-
-if errors:
-    print("Пароль ненадежный. Отсутствует:", ", ".join(errors))
-else:
-    print("Пароль надежный")
\ No newline at end of file
+import argparse
+import os
+from collections import Counter
+from functools import partial
+from multiprocessing import Pool
+
+UPPER, LOWER, DIGIT, SPECIAL = 1, 2, 4, 8
+ALL_CLASSES = UPPER | LOWER | DIGIT | SPECIAL
+TOO_SHORT = 16  # нарушение длины в маске нарушений
+
+# Класс символов -> сообщение о его отсутствии
+CLASS_MESSAGES = (
+    (UPPER, "нет заглавных букв"),
+    (LOWER, "нет строчных букв"),
+    (DIGIT, "нет цифр"),
+    (SPECIAL, "нет специальных символов"),
+)
+
+_char_classes = {}  # символ -> битовая маска классов, заполняется по мере появления символов
+
+
+def _char_mask(c):
+    mask = 0
+    if c.isupper():
+        mask |= UPPER
+    elif c.islower():
+        mask |= LOWER
+    if c.isdigit():
+        mask |= DIGIT
+    if not c.isalnum():
+        mask |= SPECIAL
+    return mask
+
+
+def password_classes(password):
+    """Маска классов символов пароля: каждый различный символ проверяется один раз"""
+    mask = 0
+    for c in set(password):
+        char_mask = _char_classes.get(c)
+        if char_mask is None:
+            char_mask = _char_classes[c] = _char_mask(c)
+        mask |= char_mask
+    return mask
+
+
+def violations(password, min_length=8, required=ALL_CLASSES):
+    """Маска нарушенных правил политики (0 — пароль надёжный)"""
+    mask = required & ~password_classes(password)
+    if len(password) < min_length:
+        mask |= TOO_SHORT
+    return mask
+
+
+def describe(mask, min_length=8):
+    """Сообщения для маски нарушений"""
+    errors = [f"длина менее {min_length} символов"] if mask & TOO_SHORT else []
+    errors.extend(message for flag, message in CLASS_MESSAGES if mask & flag)
+    return errors
+
+
+def check_password(password, min_length=8, required=ALL_CLASSES):
+    """Список невыполненных требований политики"""
+    return describe(violations(password, min_length, required), min_length)
+
+
+def audit(path, min_length=8, required=ALL_CLASSES, workers=None):
+    """Проверка паролей из файла (по одному в строке); возвращает (всего, надёжных, счётчик нарушений)"""
+    check = partial(violations, min_length=min_length, required=required)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        passwords = (line.rstrip("\r\n") for line in f)
+        if (workers or os.cpu_count() or 1) > 1:
+            # Между процессами передаются только маски нарушений
+            with Pool(workers) as pool:
+                masks = Counter(pool.imap(check, passwords, chunksize=10000))
+        else:
+            masks = Counter(map(check, passwords))
+
+    failures = Counter()
+    for mask, count in masks.items():
+        for message in describe(mask, min_length):
+            failures[message] += count
+    return sum(masks.values()), masks[0], failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Проверка надёжности паролей")
+    parser.add_argument("file", nargs="?", help="файл с паролями для пакетной проверки, по одному в строке")
+    parser.add_argument("--min-length", type=int, default=8)
+    parser.add_argument("--no-special", action="store_true", help="не требовать специальных символов")
+    args = parser.parse_args()
+    required = ALL_CLASSES & ~SPECIAL if args.no_special else ALL_CLASSES
+
+    if args.file:
+        total, passed, failures = audit(args.file, args.min_length, required)
+        print(f"Проверено паролей: {total}, надёжных: {passed}")
+        for message, count in failures.most_common():
+            print(f"{message}: {count} ({count / total:.1%})")
+    else:
+        password = input("Введите пароль: ")
+        errors = check_password(password, args.min_length, required)
+        if errors:
+            print("Пароль ненадежный. Отсутствует:", ", ".join(errors))
+        else:
+            print("Пароль надежный")
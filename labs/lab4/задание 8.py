@@ -1,13 +1,52 @@
-purchase = float(input("Введите сумму покупки: "))
-if purchase < 1000:
-    discount = 0
-elif purchase <= 5000:
-    discount = 5
-elif purchase <= 10000:
-    discount = 10
-else:
-    discount = 15
-
-final_price = purchase * (1 - discount / 100)
-print(f"Скидка: {discount}%")
-print(f"Итоговая сумма: {final_price:.2f}")
\ No newline at end of file
+import sys
+from bisect import bisect_left
+
+try:
+    import numpy as np  # векторный расчёт скидок для файла сумм, если numpy установлен
+except ImportError:
+    np = None
+
+MIN_PURCHASE = 1000  # при меньшей сумме скидки нет
+DISCOUNT_LIMITS = [5000, 10000]  # верхние границы уровней скидки (включительно)
+DISCOUNTS = [5, 10, 15]
+
+
+def discount_for(purchase):
+    if purchase != purchase:
+        return DISCOUNTS[-1]  # NaN не проходит ни одно сравнение, исходная цепочка if/elif доходила до else
+    if purchase < MIN_PURCHASE:
+        return 0
+    return DISCOUNTS[bisect_left(DISCOUNT_LIMITS, purchase)]
+
+
+def discounts_for(purchases):
+    """Скидки для списка сумм; с numpy — за один векторный проход"""
+    if np is None:
+        return [discount_for(purchase) for purchase in purchases]
+    values = np.asarray(purchases, dtype=float)
+    # searchsorted ставит NaN после всех границ, то есть тоже на последний уровень
+    tiers = np.array(DISCOUNTS)[np.searchsorted(DISCOUNT_LIMITS, values, side="left")]
+    return np.where(values < MIN_PURCHASE, 0, tiers).tolist()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Пакетный режим: файл с суммами покупок, по одной в строке
+        purchases = []
+        with open(sys.argv[1], encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        purchases.append(float(line))
+                    except ValueError:
+                        # Неверная строка пропускается, остальные обрабатываются
+                        print(f"{sys.argv[1]}:{number}: ошибка: неверная сумма покупки {line.strip()!r}", file=sys.stderr)
+        for purchase, discount in zip(purchases, discounts_for(purchases)):
+            print(f"{purchase:.2f}: скидка {discount}%, итого {purchase * (1 - discount / 100):.2f}")
+    else:
+        purchase = float(input("Введите сумму покупки: "))
+        discount = discount_for(purchase)
+
+        final_price = purchase * (1 - discount / 100)
+        print(f"Скидка: {discount}%")
+        print(f"Итоговая сумма: {final_price:.2f}")
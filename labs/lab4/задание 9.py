@@ -1,9 +1,41 @@
-hour = int(input("Введите час (0-23): "))
-if 0 <= hour <= 5:
-    print("Ночь")
-elif 6 <= hour <= 11:
-    print("Утро")
-elif 12 <= hour <= 17:
-    print("День")
-else:
-    print("Вечер")
\ No newline at end of file
+import sys
+from bisect import bisect_right
+
+try:
+    import numpy as np  # векторная классификация файла часов, если numpy установлен
+except ImportError:
+    np = None
+
+PART_STARTS = [0, 6, 12, 18]  # первые часы ночи, утра, дня и вечера
+PARTS_OF_DAY = ["Вечер", "Ночь", "Утро", "День", "Вечер"]  # час меньше 0 — «Вечер», как в исходной цепочке
+
+
+def part_of_day(hour):
+    """Время суток для целого часа"""
+    return PARTS_OF_DAY[bisect_right(PART_STARTS, hour)]
+
+
+def parts_of_day(hours):
+    """Время суток для списка целых часов; с numpy — за один векторный проход"""
+    if np is None:
+        return [part_of_day(hour) for hour in hours]
+    return np.array(PARTS_OF_DAY)[np.searchsorted(PART_STARTS, hours, side="right")].tolist()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Пакетный режим: файл с часами, по одному в строке
+        hours = []
+        with open(sys.argv[1], encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        hours.append(int(line))
+                    except ValueError:
+                        # Неверная строка пропускается, остальные обрабатываются
+                        print(f"{sys.argv[1]}:{number}: ошибка: неверный час {line.strip()!r}", file=sys.stderr)
+        for hour, part in zip(hours, parts_of_day(hours)):
+            print(f"{hour}: {part}")
+    else:
+        hour = int(input("Введите час (0-23): "))
+        print(part_of_day(hour))
@@ -1,9 +1,51 @@
-students = []
+import heapq
+
+
+class Aggregate:
+    """Накопительные count/sum/min/max по группе без хранения самих значений"""
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+
+class GroupBy:
+    """Группировка потока записей (ключ, значение) с агрегатами по каждому ключу"""
+
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, key, value):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = Aggregate()
+        group.add(value)
+
+    def top(self, k, by="mean"):
+        """k групп с наибольшим значением агрегата (через кучу, без полной сортировки)"""
+        return heapq.nlargest(k, self.groups.items(), key=lambda item: getattr(item[1], by))
+
+
+grades = GroupBy()
 n = int(input("Сколько студентов? "))
 for i in range(n):
     name = input("Имя студента: ")
-    grades = list(map(int, input("Оценки через пробел: ").split()))
-    students.append((name, grades))
-averages = {name: sum(grades)/len(grades) for name, grades in students}
-best_student = max(averages, key=averages.get)
-print(f"У {best_student} самый высокий средний балл: {averages[best_student]:.1f}")
\ No newline at end of file
+    for grade in map(int, input("Оценки через пробел: ").split()):
+        grades.add(name, grade)
+(best_student, best), = grades.top(1)
+print(f"У {best_student} самый высокий средний балл: {best.mean:.1f}")
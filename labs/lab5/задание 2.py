@@ -1,3 +1,9 @@
-numbers = list(map(int, input("Введите 5 чисел через пробел: ").split()))
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fastio
+
+numbers = fastio.ints("Введите 5 чисел через пробел: ")
 squares = [x*x for x in numbers]
 print(squares)
\ No newline at end of file
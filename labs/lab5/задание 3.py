@@ -1,3 +1,9 @@
-numbers = list(map(int, input("Введите числа через пробел: ").split()))
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fastio
+
+numbers = fastio.ints("Введите числа через пробел: ")
 result = max(numbers) / len(numbers)
 print(result)
\ No newline at end of file
@@ -1,15 +1,58 @@
-def sort_tuple(t):
-    if all(type(x) in (int, float) for x in t):
-        return tuple(sorted(t))
-    return t
-user_input = input("Введите элементы кортежа через пробел: ").split()
-tuple_data = []
-for item in user_input:
+import re
+
+# Обычная десятичная запись дробного числа: 1.5, .5, 1., 2e10, -3.1E-2
+FLOAT_TOKEN = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?").fullmatch
+# Нечисловые значения, которые понимает float()
+SPECIAL_FLOAT = re.compile(r"[+-]?(?:inf|infinity|nan)", re.IGNORECASE).fullmatch
+HAS_DIGIT = re.compile(r"\d").search
+LONG_TOKEN = 4000  # длинные числа упираются в ограничение int() на число цифр
+
+
+def parse_token_slow(item):
+    """Редкие записи (1_000, цифры других алфавитов, очень длинные числа) — как раньше, через исключения"""
     try:
-        tuple_data.append(int(item))
-    except:
+        return int(item), True
+    except ValueError:
         try:
-            tuple_data.append(float(item))
-        except:
-            tuple_data.append(item)
-print(sort_tuple(tuple(tuple_data)))
\ No newline at end of file
+            return float(item), True
+        except ValueError:
+            return item, False
+
+
+def parse_tokens(tokens):
+    """Значения токенов и признак того, что все они числа"""
+    try:
+        return list(map(int, tokens)), True  # самый частый случай — только целые
+    except ValueError:
+        pass
+
+    values = []
+    numeric = True
+    for item in tokens:
+        if len(item) >= LONG_TOKEN:
+            value, is_number = parse_token_slow(item)
+        elif item.isdecimal() or (item[0] in "+-" and item[1:].isdecimal()):
+            value, is_number = int(item), True
+        elif FLOAT_TOKEN(item) or SPECIAL_FLOAT(item):
+            value, is_number = float(item), True
+        elif not HAS_DIGIT(item):
+            value, is_number = item, False
+        else:
+            value, is_number = parse_token_slow(item)
+        values.append(value)
+        numeric = numeric and is_number
+    return values, numeric
+
+
+def sort_tuple(t, numeric=None):
+    if numeric is None:
+        numeric = all(type(x) in (int, float) for x in t)
+    if numeric:
+        return tuple(sorted(t))
+    return t
+
+
+if __name__ == "__main__":
+    user_input = input("Введите элементы кортежа через пробел: ").split()
+    tuple_data, numeric = parse_tokens(user_input)
+    print(sort_tuple(tuple(tuple_data), numeric))
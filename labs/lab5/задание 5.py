@@ -4,7 +4,12 @@ for i in range(n):
     name = input("Название товара: ")
     price = int(input("Цена: "))
     products[name] = price
-min_product = min(products, key=products.get)
-max_product = max(products, key=products.get)
+# Минимум и максимум за один проход
+min_product = max_product = next(iter(products))
+for name, price in products.items():
+    if price < products[min_product]:
+        min_product = name
+    elif price > products[max_product]:
+        max_product = name
 print(f"Минимальная цена: {min_product} - {products[min_product]}")
 print(f"Максимальная цена: {max_product} - {products[max_product]}")
\ No newline at end of file
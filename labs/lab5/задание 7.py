@@ -1,8 +1,60 @@
-dictionary = {"apple": "яблоко", "cat": "кот", "house": "дом", "dog": "собака", "book": "книга"}
+import sys
+from bisect import bisect_left
+
+
+class BiDict:
+    """Двунаправленный словарь: хеш-индексы в обе стороны, у слова может быть несколько переводов"""
+
+    def __init__(self, pairs=()):
+        self.forward = {}   # английское слово -> русские (dict как упорядоченное множество)
+        self.backward = {}  # русское слово -> английские
+        self._sorted = None  # отсортированные русские слова для поиска по префиксу
+        for eng, rus in pairs:
+            self.add(eng, rus)
+
+    def add(self, eng, rus):
+        self.forward.setdefault(eng, {})[rus] = None
+        self.backward.setdefault(rus, {})[eng] = None
+        self._sorted = None
+
+    def load(self, path):
+        """Загрузка пар «английское<TAB>русское» из файла UTF-8, по строке на пару"""
+        with open(path, 'r', encoding='utf-8', newline='\n') as f:
+            for line in f:
+                eng, sep, rus = line.rstrip("\r\n").partition("\t")
+                if sep:
+                    self.add(eng, rus)
+
+    def to_english(self, rus):
+        return list(self.backward.get(rus, ()))
+
+    def to_russian(self, eng):
+        return list(self.forward.get(eng, ()))
+
+    def complete(self, prefix, limit=10):
+        """Русские слова, начинающиеся с prefix (бинарный поиск по отсортированному списку)"""
+        if self._sorted is None:
+            self._sorted = sorted(self.backward)
+        words = self._sorted
+        start = bisect_left(words, prefix)
+        result = []
+        for i in range(start, min(start + limit, len(words))):
+            if not words[i].startswith(prefix):
+                break
+            result.append(words[i])
+        return result
+
+
+dictionary = BiDict({"apple": "яблоко", "cat": "кот", "house": "дом", "dog": "собака", "book": "книга"}.items())
+if len(sys.argv) > 1:
+    dictionary.load(sys.argv[1])  # python "задание 7.py" словарь.tsv
+
 russian_word = input("Введите русское слово: ")
-for eng, rus in dictionary.items():
-    if rus == russian_word:
-        print(f"Перевод: {eng}")
-        break
+translations = dictionary.to_english(russian_word)
+if translations:
+    print(f"Перевод: {', '.join(translations)}")
 else:
-    print("Слово не найдено")
\ No newline at end of file
+    print("Слово не найдено")
+    suggestions = dictionary.complete(russian_word) if russian_word else []
+    if suggestions:
+        print(f"Возможно, вы имели в виду: {', '.join(suggestions)}")
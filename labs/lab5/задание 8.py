@@ -1,14 +1,185 @@
+import argparse
+import os
 import random
+from itertools import combinations
+from math import sqrt
+from multiprocessing import Pool
+
 variants = ["камень", "ножницы", "бумага", "ящерица", "спок"]
-user = input("Выберите: камень, ножницы, бумага, ящерица, спок: ").lower()
-comp = random.choice(variants)
-print(f"Компьютер выбрал: {comp}")
-if user == comp:
-    print("Ничья!")
-elif (user, comp) in [("ножницы", "бумага"), ("бумага", "камень"), ("камень", "ящерица"), 
-                      ("ящерица", "спок"), ("спок", "ножницы"), ("ножницы", "ящерица"), 
-                      ("ящерица", "бумага"), ("бумага", "спок"), ("спок", "камень"), 
-                      ("камень", "ножницы")]:
-    print("Вы победили!")
-else:
-    print("Вы проиграли!")
\ No newline at end of file
+INDEX = {name: i for i, name in enumerate(variants)}
+
+# (победитель, проигравший)
+BEATS = {("ножницы", "бумага"), ("бумага", "камень"), ("камень", "ящерица"),
+         ("ящерица", "спок"), ("спок", "ножницы"), ("ножницы", "ящерица"),
+         ("ящерица", "бумага"), ("бумага", "спок"), ("спок", "камень"),
+         ("камень", "ножницы")}
+
+WIN, DRAW, LOSS = 1, 0, -1
+# OUTCOME[i][j] — исход для хода i против хода j
+OUTCOME = [[WIN if (a, b) in BEATS else DRAW if a == b else LOSS for b in variants] for a in variants]
+# Ходы, побеждающие данный ход
+COUNTERS = [[i for i in range(len(variants)) if OUTCOME[i][j] == WIN] for j in range(len(variants))]
+
+CHUNK_ROUNDS = 100_000  # раундов в одной задаче пула; от числа процессов не зависит
+
+
+def result(user, comp):
+    """Исход раунда для игрока; неизвестный ход — поражение"""
+    if user not in INDEX:
+        return LOSS
+    return OUTCOME[INDEX[user]][INDEX[comp]]
+
+
+class RandomStrategy:
+    """Случайный ход"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def move(self):
+        return self.rng.randrange(len(variants))
+
+    def observe(self, own, opponent):
+        pass
+
+
+class FrequencyStrategy(RandomStrategy):
+    """Ход против самого частого хода соперника"""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.counts = [0] * len(variants)
+        self.rounds = 0
+
+    def move(self):
+        if not self.rounds:
+            return super().move()
+        predicted = max(range(len(variants)), key=self.counts.__getitem__)
+        return self.rng.choice(COUNTERS[predicted])
+
+    def observe(self, own, opponent):
+        self.counts[opponent] += 1
+        self.rounds += 1
+
+
+class MarkovStrategy(RandomStrategy):
+    """Ход против самого частого продолжения последнего хода соперника"""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.transitions = [[0] * len(variants) for _ in variants]
+        self.last = None
+
+    def move(self):
+        if self.last is None:
+            return super().move()
+        counts = self.transitions[self.last]
+        predicted = max(range(len(variants)), key=counts.__getitem__)
+        if not counts[predicted]:
+            return super().move()
+        return self.rng.choice(COUNTERS[predicted])
+
+    def observe(self, own, opponent):
+        if self.last is not None:
+            self.transitions[self.last][opponent] += 1
+        self.last = opponent
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "markov": MarkovStrategy,
+}
+
+
+def play_match(first, second, rounds, seed):
+    """Матч двух стратегий, возвращает (победы, ничьи, поражения) первой"""
+    rng = random.Random(seed)
+    a = STRATEGIES[first](random.Random(rng.getrandbits(64)))
+    b = STRATEGIES[second](random.Random(rng.getrandbits(64)))
+    totals = {WIN: 0, DRAW: 0, LOSS: 0}
+    for _ in range(rounds):
+        move_a, move_b = a.move(), b.move()
+        totals[OUTCOME[move_a][move_b]] += 1
+        a.observe(move_a, move_b)
+        b.observe(move_b, move_a)
+    return totals[WIN], totals[DRAW], totals[LOSS]
+
+
+def _play_chunk(task):
+    pair, rounds, seed = task
+    return pair, play_match(*pair, rounds, seed)
+
+
+def wilson(successes, total, z=1.96):
+    """Доверительный интервал Уилсона для доли успехов"""
+    if not total:
+        return 0.0, 0.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    margin = z * sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return center - margin, center + margin
+
+
+def tournament(names, rounds, seed=0, workers=None):
+    """Круговой турнир: каждая пара стратегий (и каждая сама с собой) играет rounds раундов.
+
+    Раунды делятся на матчи по CHUNK_ROUNDS, у каждого матча своё зерно,
+    выведенное из seed, пары и номера матча, поэтому результат не зависит от числа процессов.
+    Адаптивные стратегии обучаются заново в каждом матче. Повторы в names отбрасываются.
+    """
+    if rounds <= 0:
+        raise ValueError("число раундов должно быть положительным")
+    names = list(dict.fromkeys(names))
+    pairs = list(combinations(names, 2)) + [(name, name) for name in names]
+    tasks = []
+    for pair in pairs:
+        for number, start in enumerate(range(0, rounds, CHUNK_ROUNDS)):
+            tasks.append((pair, min(CHUNK_ROUNDS, rounds - start), f"{seed}:{pair[0]}:{pair[1]}:{number}"))
+
+    totals = {pair: [0, 0, 0] for pair in pairs}
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with Pool(workers) as pool:
+            results = list(pool.imap_unordered(_play_chunk, tasks))
+    else:
+        results = map(_play_chunk, tasks)
+    for pair, counts in results:
+        for i, count in enumerate(counts):
+            totals[pair][i] += count
+    return totals
+
+
+def report(totals):
+    for (first, second), (wins, draws, losses) in totals.items():
+        total = wins + draws + losses
+        low, high = wilson(wins, total)
+        print(f"{first} против {second}: победы {wins / total:.2%} [{low:.2%}; {high:.2%}], "
+              f"ничьи {draws / total:.2%}, поражения {losses / total:.2%} ({total} раундов)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Камень, ножницы, бумага, ящерица, Спок")
+    parser.add_argument("--tournament", nargs="*", metavar="STRATEGY", choices=list(STRATEGIES),
+                        help="турнир стратегий (по умолчанию все)")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="раундов на пару стратегий")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    if args.rounds <= 0:
+        parser.error("--rounds должно быть положительным")
+
+    if args.tournament is not None:
+        report(tournament(args.tournament or list(STRATEGIES), args.rounds, args.seed, args.workers))
+    else:
+        user = input("Выберите: камень, ножницы, бумага, ящерица, спок: ").lower()
+        comp = random.choice(variants)
+        print(f"Компьютер выбрал: {comp}")
+        outcome = result(user, comp)
+        if outcome == DRAW:
+            print("Ничья!")
+        elif outcome == WIN:
+            print("Вы победили!")
+        else:
+            print("Вы проиграли!")
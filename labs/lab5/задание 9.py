@@ -1,8 +1,5 @@
 words = input("Введите слова через пробел: ").split()
 result = {}
 for word in words:
-    first_letter = word[0]
-    if first_letter not in result:
-        result[first_letter] = []
-    result[first_letter].append(word)
+    result.setdefault(word[0], []).append(word)  # один поиск ключа на слово
 print(result)
\ No newline at end of file
@@ -1,30 +1,73 @@
-def time_convert():
-    time = {
-        's': 1, 'sec': 1, 'second': 1,
-        'm': 60, 'min': 60, 'minute': 60,
-        'h': 3600, 'hr': 3600, 'hour': 3600,
-        'd': 86400, 'day': 86400
-    }
+import sys
+from functools import lru_cache
+
+# Единицы времени в секундах; таблица строится один раз при загрузке
+TIME_UNITS = {
+    's': 1, 'sec': 1, 'second': 1,
+    'm': 60, 'min': 60, 'minute': 60,
+    'h': 3600, 'hr': 3600, 'hour': 3600,
+    'd': 86400, 'day': 86400
+}
+
+
+@lru_cache(maxsize=1024)
+def unit_factors(from_time, to_time):
+    """Множители (из, в) для пары единиц в любом регистре или None для неизвестной единицы"""
+    from_time, to_time = from_time.lower(), to_time.lower()
+    if from_time in TIME_UNITS and to_time in TIME_UNITS:
+        return TIME_UNITS[from_time], TIME_UNITS[to_time]
+    return None
+
+
+def convert_many(values, from_time, to_time):
+    """Перевод последовательности значений между двумя единицами"""
+    factors = unit_factors(from_time, to_time)
+    if factors is None:
+        raise ValueError(f"неизвестная единица измерения: {from_time} или {to_time}")
+    multiplier, divisor = factors
+    return [value * multiplier / divisor for value in values]
+
 
+def format_result(result, to_time):
+    if result.is_integer():
+        return f"{int(result)}{to_time}"
+    return f"{result:.2f}{to_time}"
+
+
+def convert_line(line):
+    """Строка «значение из в» -> строка результата (ValueError при ошибке формата)"""
+    value, from_time, to_time = line.split()
+    value = float(value)
+    factors = unit_factors(from_time, to_time)
+    if factors is None:
+        return None
+    return format_result(value * factors[0] / factors[1], to_time.lower())
+
+
+def time_convert():
     user_input = input("Введите время для конвертации: ")
     
     try:
-        value, from_time, to_time = user_input.split()
-        value = float(value)
-        from_time = from_time.lower()
-        to_time = to_time.lower()
-        
-        if from_time in time and to_time in time:
-            result = value * time[from_time] / time[to_time]
-            
-            if result.is_integer():
-                print(f"Результат: {int(result)}{to_time}")
-            else:
-                print(f"Результат: {result:.2f}{to_time}")
+        result = convert_line(user_input)
+        if result is not None:
+            print(f"Результат: {result}")
         else:
             print("Ошибка: неизвестная единица измерения.")
             
     except ValueError:
         print("Ошибка: неверный формат ввода.")
 
-time_convert()
\ No newline at end of file
+
+if len(sys.argv) > 1:
+    # python "задание 1.py" файл — по строке «значение из в» на каждую конвертацию
+    with open(sys.argv[1], encoding="utf-8") as f:
+        out = []
+        for line in f:
+            try:
+                result = convert_line(line)
+            except ValueError:
+                result = None
+            out.append(result if result is not None else "Ошибка")
+        sys.stdout.write("\n".join(out) + "\n")
+else:
+    time_convert()
@@ -1,12 +1,70 @@
+import math
+import sys
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+try:
+    import numpy as np  # векторный расчёт больших наборов сценариев
+except ImportError:
+    np = None
+
+MIN_AMOUNT = 30000
+MAX_TIER = 17  # начиная с 170 000 руб. надбавка упирается в потолок 5%
+
+
+def term_rate(n):
+    return 0.03 if n <= 3 else 0.05 if n <= 6 else 0.02
+
+
+@lru_cache(maxsize=4096)
+def growth(tier, n):
+    """Множитель роста вклада за n лет для уровня суммы tier (a // 10000)"""
+    bonus = min(tier * 0.003, 0.05)
+    return (1 + term_rate(n) + bonus) ** n
+
+
+@lru_cache(maxsize=4096)
+def growth_exact(tier, n):
+    """То же в точной десятичной арифметике"""
+    term = Decimal("0.03") if n <= 3 else Decimal("0.05") if n <= 6 else Decimal("0.02")
+    bonus = min(tier * Decimal("0.003"), Decimal("0.05"))
+    return (1 + term + bonus) ** n
+
+
+def profit(a, n, exact=False):
+    """Прибыль по вкладу или None, если сумма меньше минимальной"""
+    if a < MIN_AMOUNT:
+        return None
+    tier = min(int(a // 10000), MAX_TIER)
+    if exact:
+        a = Decimal(str(a))
+        return a * growth_exact(tier, n) - a
+    return a * growth(tier, n) - a
+
+
+def profits(amounts, terms, exact=False):
+    """Прибыль для пар (сумма, срок) одним вызовом; None там, где сумма меньше минимальной"""
+    if np is None or exact:
+        return [profit(a, n, exact) for a, n in zip(amounts, terms)]
+    a = np.asarray(amounts, dtype=float)
+    n = np.asarray(terms, dtype=float)
+    term = np.where(n <= 3, 0.03, np.where(n <= 6, 0.05, 0.02))
+    bonus = np.minimum(np.minimum(a // 10000, MAX_TIER) * 0.003, 0.05)
+    result = a * (1 + term + bonus) ** n - a
+    return [p if valid else None for p, valid in zip(result.tolist(), (a >= MIN_AMOUNT).tolist())]
+
+
+def profit_grid(amounts, terms, exact=False):
+    """Таблица прибыли: строка на каждую сумму, столбец на каждый срок"""
+    return [profits([a] * len(terms), terms, exact) for a in amounts]
+
+
 def calculate_profit(a, n):
-    if a < 30000:
+    result = profit(a, n)
+    if result is None:
         return "Ошибка: минимальная сумма 30 000 руб."
     
-    term = 0.03 if n <= 3 else 0.05 if n <= 6 else 0.02
-    sum = min((a // 10000) * 0.003, 0.05)
-    profit = a * (1 + term + sum) ** n - a
-    
-    return f"Прибыль: {round(profit, 2):,.2f} руб."
+    return f"Прибыль: {round(result, 2):,.2f} руб."
 
 def main_compact():
     print("Калькулятор вклада сумма(, срок):")
@@ -23,7 +81,53 @@ def main_compact():
             
         except (ValueError, IndexError):
             print("Ошибка ввода!")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nВыход")
             break
 
+
+def parse_scenario(line, exact=False):
+    """Сумма и срок из строки «сумма срок»; ValueError, если строка неверная"""
+    try:
+        amount, years = line.split()
+        amount = Decimal(amount) if exact else float(amount)
+        years = int(years)
+    except (ValueError, InvalidOperation):
+        raise ValueError(f"ожидается «сумма срок», получено {line.strip()!r}")
+    if not math.isfinite(amount):
+        raise ValueError(f"сумма должна быть числом, получено {line.split()[0]!r}")
+    return amount, years
+
+
+def main_batch(path, exact=False):
+    """Расчёт сценариев из файла (строки «сумма срок»), вывод таблицей.
+
+    Неверные строки пропускаются, о каждой пишется в stderr с номером строки.
+    """
+    amounts, terms = [], []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                try:
+                    amount, years = parse_scenario(line, exact)
+                except ValueError as e:
+                    print(f"{path}:{number}: ошибка: {e}", file=sys.stderr)
+                    continue
+                amounts.append(amount)
+                terms.append(years)
+    
+    out = sys.stdout
+    out.write("Сумма\tСрок\tПрибыль\n")
+    for amount, years, result in zip(amounts, terms, profits(amounts, terms, exact)):
+        value = "ошибка: сумма меньше 30 000" if result is None else f"{result:.2f}"
+        out.write(f"{amount}\t{years}\t{value}\n")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args:
+        # python "задание 2.py" [--exact] сценарии.txt
+        exact = "--exact" in args
+        main_batch([arg for arg in args if arg != "--exact"][0], exact)
+    else:
+        main_compact()
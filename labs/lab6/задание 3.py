@@ -1,14 +1,108 @@
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
+
+SEGMENT_SIZE = 1 << 18  # чисел в одном сегменте решета
+
+# Кэш простых чисел для просеивания сегментов, расширяется по мере надобности
+_base_limit = 1
+_base_primes = []
+
+
+def base_primes(limit):
+    """Простые числа до limit (обычное решето Эратосфена, результат кэшируется)"""
+    global _base_limit, _base_primes
+    if limit > _base_limit:
+        sieve = bytearray([1]) * (limit + 1)
+        sieve[:2] = b"\x00\x00"
+        for i in range(2, isqrt(limit) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes((limit - i * i) // i + 1)
+        _base_primes = list(compress(range(limit + 1), sieve))
+        _base_limit = limit
+    return _base_primes
+
+
+def sieve_segment(low, high):
+    """Решето отрезка [low, high]: segment[i] == 1, если low + i простое"""
+    size = high - low + 1
+    segment = bytearray([1]) * size
+    for p in base_primes(isqrt(high)):
+        if p * p > high:
+            break
+        start = max(p * p, (low + p - 1) // p * p) - low  # первое кратное p в сегменте
+        if start < size:
+            segment[start::p] = bytes((size - 1 - start) // p + 1)
+    return segment
+
+
+def segments(a, b):
+    """Границы сегментов отрезка [a, b], выдаются по одной"""
+    for low in range(a, b + 1, SEGMENT_SIZE):
+        yield low, min(low + SEGMENT_SIZE - 1, b)
+
+
+def iter_primes(a, b, workers=1):
+    """Генератор простых чисел из [a, b]; память ограничена размером сегмента"""
+    a = max(a, 2)
+    if a > b:
+        return
+    if workers > 1 and b - a >= SEGMENT_SIZE:
+        # Между процессами передаются только сегменты-байтовые массивы.
+        # В работе не больше 2 * workers сегментов: если потребитель медленнее
+        # пула, новые задачи не ставятся и готовые сегменты не копятся.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for low, high in segments(a, b):
+                pending.append((low, high, executor.submit(sieve_segment, low, high)))
+                if len(pending) >= 2 * workers:
+                    low, high, future = pending.popleft()
+                    yield from compress(range(low, high + 1), future.result())
+            for low, high, future in pending:
+                yield from compress(range(low, high + 1), future.result())
+    else:
+        for low, high in segments(a, b):
+            yield from compress(range(low, high + 1), sieve_segment(low, high))
+
+
 def primes(a, b):
+    primes_list = list(iter_primes(a, b))
+    return primes_list if primes_list else "Error!"
+
+
+def primes_trial(a, b):
+    """Прежняя версия: перебор делителей до корня для каждого числа (для сравнения)"""
     primes_list = []
     for num in range(max(2, a), b + 1):
-        if num > 1:
-            for i in range(2, int(num**0.5) + 1):
-                if num % i == 0:
-                    break
-            else:
-                primes_list.append(num)
+        for i in range(2, isqrt(num) + 1):
+            if num % i == 0:
+                break
+        else:
+            primes_list.append(num)
     return primes_list if primes_list else "Error!"
 
-a = int(input("Начало диапазона: "))
-b = int(input("Конец диапазона: "))
-print(primes(a, b))
\ No newline at end of file
+
+def benchmark(a, b, workers):
+    """Время прежней и новой версии на отрезке [a, b]"""
+    start = time.perf_counter()
+    expected = primes_trial(a, b)
+    print(f"перебор делителей: {time.perf_counter() - start:.2f} с")
+    for count in sorted({1, workers}):
+        start = time.perf_counter()
+        found = list(iter_primes(a, b, count)) or "Error!"
+        print(f"решето, процессов {count}: {time.perf_counter() - start:.2f} с, "
+              f"{'совпадает' if found == expected else 'РАСХОЖДЕНИЕ'}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--benchmark"]:
+        a, b = (int(x) for x in sys.argv[2:4]) if len(sys.argv) >= 4 else (1, 2_000_000)
+        benchmark(a, b, os.cpu_count() or 1)
+    else:
+        a = int(input("Начало диапазона: "))
+        b = int(input("Конец диапазона: "))
+        print(primes(a, b))
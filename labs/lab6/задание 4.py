@@ -1,21 +1,88 @@
+import os
+import sys
+from array import array
+
+try:
+    import numpy as np  # ускорение сложения, если numpy установлен
+except ImportError:
+    np = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fastio
+
+
+class Matrix:
+    """Матрица n×n, хранящаяся по строкам в одном плоском массиве.
+
+    Обычно это array('q'); если какое-то число не помещается в int64,
+    матрица хранится в списке int Python, как в исходной программе.
+    """
+
+    def __init__(self, n, data):
+        self.n = n
+        self.data = data
+
+    @classmethod
+    def read(cls, n, stream):
+        """Чтение n строк по n целых чисел, разделённых пробелами (лишние числа в строке отбрасываются)"""
+        data = array('q')
+        for _ in range(n):
+            row = fastio.parse_int64(stream.readline())
+            if len(row) < n:
+                raise ValueError("короткая строка матрицы")
+            if isinstance(data, array) and not isinstance(row, array):
+                data = data.tolist()
+            data.extend(row[:n] if len(row) > n else row)
+        return cls(n, data)
+
+    def _combine(self, other, sign):
+        op = int.__add__ if sign > 0 else int.__sub__
+        if isinstance(self.data, array) and isinstance(other.data, array):
+            if np is not None:
+                a = np.frombuffer(self.data, dtype=np.int64)
+                b = np.frombuffer(other.data, dtype=np.int64)
+                result = a + b if sign > 0 else a - b
+                # numpy молча переполняется: знак результата тогда не совпадает со знаком a
+                # и со знаком b (при сложении) или -b (при вычитании)
+                overflow = (a ^ result) & ((b if sign > 0 else ~b) ^ result)
+                if not (overflow < 0).any():
+                    return Matrix(self.n, array('q', result.tobytes()))
+            else:
+                try:
+                    return Matrix(self.n, array('q', map(op, self.data, other.data)))
+                except OverflowError:
+                    pass
+        return Matrix(self.n, list(map(op, self.data, other.data)))
+
+    def __add__(self, other):
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    def rows(self):
+        n, data = self.n, self.data
+        for i in range(0, n * n, n):
+            yield data[i:i + n]
+
+
 def add_matrices():
     try:
-        n = int(input("Введите размер матрицы: "))
+        n = int(fastio.line("Введите размер матрицы: "))
         if n <= 2:
             print("Error!")
             return
         
         print("Введите первую матрицу:")
-        matrix1 = [list(map(int, input().split())) for _ in range(n)]
+        matrix1 = Matrix.read(n, fastio.stdin())
         
         print("Введите вторую матрицу:")
-        matrix2 = [list(map(int, input().split())) for _ in range(n)]
+        matrix2 = Matrix.read(n, fastio.stdin())
         
         print("Результат:")
-        for i in range(n):
-            print(' '.join(str(matrix1[i][j] + matrix2[i][j]) for j in range(n)))
+        sys.stdout.write("\n".join(" ".join(map(str, row)) for row in (matrix1 + matrix2).rows()) + "\n")
             
     except:
         print("Error!")
 
-add_matrices()
\ No newline at end of file
+add_matrices()
@@ -1,3 +1,115 @@
-s = input().strip()
-cleaned = ''.join(c.lower() for c in s if c.isalnum())
-print("Да" if cleaned == cleaned[::-1] else "Нет")
\ No newline at end of file
+import mmap
+import os
+import sys
+from multiprocessing import Pool
+
+
+def _lowered(chars, backward=False):
+    """Кодовые точки очищенной строки в нижнем регистре, как в ''.join(c.lower() for c in s if c.isalnum());
+    для символов, идущих с конца (backward=True), — тоже с конца"""
+    for c in chars:
+        if c.isalnum():
+            yield from reversed(c.lower()) if backward else c.lower()
+
+
+def _same_both_ways(forward, backward):
+    """Сравнение очищенного текста с перевёрнутым целиком, по кодовым точкам.
+
+    Нужно, когда c.lower() даёт несколько символов ('İ' -> 'i' + точка сверху):
+    тогда посимвольное сравнение пар не совпадает с разворотом строки.
+    """
+    return all(a == b for a, b in zip(_lowered(forward), _lowered(backward, backward=True)))
+
+
+def is_palindrome(s):
+    """Два указателя с пропуском небуквенно-цифровых символов, без копий строки"""
+    i, j = 0, len(s) - 1
+    while i < j:
+        if not s[i].isalnum():
+            i += 1
+        elif not s[j].isalnum():
+            j -= 1
+        else:
+            left, right = s[i].lower(), s[j].lower()
+            if len(left) != 1 or len(right) != 1:
+                return _same_both_ways(s, reversed(s))
+            if left != right:
+                return False
+            i += 1
+            j -= 1
+    if i == j and len(s[i].lower()) != 1 and s[i].isalnum():
+        return _same_both_ways(s, reversed(s))
+    return True
+
+
+def _char_len(lead):
+    """Длина символа UTF-8 по первому байту"""
+    return 1 if lead < 0x80 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+
+
+def _file_chars(data):
+    i = 0
+    while i < len(data):
+        end = i + _char_len(data[i])
+        yield data[i:end].decode('utf-8')
+        i = end
+
+
+def _file_chars_reversed(data):
+    j = len(data)
+    while j > 0:
+        start = j - 1
+        while data[start] & 0xC0 == 0x80:
+            start -= 1
+        yield data[start:j].decode('utf-8')
+        j = start
+
+
+def is_palindrome_file(path):
+    """Проверка всего текста файла (UTF-8) через mmap: два указателя по байтам"""
+    if os.path.getsize(path) == 0:
+        return True
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        i, j = 0, len(data)  # [i, j) — ещё не проверенная часть
+        while i < j:
+            left_end = i + _char_len(data[i])
+            left = data[i:left_end].decode('utf-8')
+            if not left.isalnum():
+                i = left_end
+                continue
+            right_start = j - 1
+            while data[right_start] & 0xC0 == 0x80:  # назад к первому байту символа
+                right_start -= 1
+            right = data[right_start:j].decode('utf-8')
+            if not right.isalnum():
+                j = right_start
+                continue
+            if right_start <= i:  # дошли до середины
+                if right_start == i and len(left.lower()) != 1:
+                    return _same_both_ways(_file_chars(data), _file_chars_reversed(data))
+                break
+            left, right = left.lower(), right.lower()
+            if len(left) != 1 or len(right) != 1:
+                return _same_both_ways(_file_chars(data), _file_chars_reversed(data))
+            if left != right:
+                return False
+            i, j = left_end, right_start
+    return True
+
+
+def check_lines(path, workers=None):
+    """Проверка каждой строки файла в нескольких процессах"""
+    with open(path, encoding='utf-8') as f, Pool(workers) as pool:
+        yield from pool.imap(is_palindrome, (line.rstrip("\n") for line in f), chunksize=10000)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--lines":
+        # python "задание 5.py" --lines файл — ответ для каждой строки
+        sys.stdout.writelines("Да\n" if result else "Нет\n" for result in check_lines(sys.argv[2]))
+    elif len(sys.argv) == 2:
+        # python "задание 5.py" файл — весь файл как одна строка
+        print("Да" if is_palindrome_file(sys.argv[1]) else "Нет")
+    else:
+        s = input().strip()
+        print("Да" if is_palindrome(s) else "Нет")
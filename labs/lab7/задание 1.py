@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 objects = [
     ("Containment Cell A", 4),
     ("Archive Vault", 1),
@@ -5,7 +7,7 @@ objects = [
     ("Observation Wing", 2)
 ]
 
-sorted_objects = sorted(objects, key=lambda item: item[1])
+sorted_objects = sorted(objects, key=itemgetter(1))  # ключ вычисляется один раз на элемент, сортировка устойчивая
 
 print("Объекты по возрастанию уровня угрозы: ")
 print(sorted_objects)
\ No newline at end of file
@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 evaluations = [
     {"name": "Agent Cole", "score": 78},
     {"name": "Dr. Weiss", "score": 92},
@@ -5,7 +7,7 @@ evaluations = [
     {"name": "Researcher Lin", "score": 88}
 ]
 
-top_eval = max(evaluations, key=lambda x: x["score"])
+top_eval = max(evaluations, key=itemgetter("score"))
 result = f"{top_eval['name']} - {top_eval['score']}"
 
 print("Сотрудник с наивысшей психологической оценкой: ")
@@ -4,15 +4,18 @@ personnel = [
     {"name": "Technician Reed", "clearance": 1}
 ]
 
-result = list(map(lambda x: {
-    "name": x["name"],
-    "clearance": x["clearance"],
-    "category": (
-        "Restricted" if x["clearance"] == 1
-        else "Confidential" if 2 <= x["clearance"] <= 3
-        else "Top Secret"
-    )
-}, personnel))
+def clearance_category(clearance):
+    if clearance == 1:
+        return "Restricted"
+    if 2 <= clearance <= 3:
+        return "Confidential"
+    return "Top Secret"
+
+# Один проход по записям вместо list(map(lambda ...))
+result = [
+    {"name": x["name"], "clearance": x["clearance"], "category": clearance_category(x["clearance"])}
+    for x in personnel
+]
 
 print("Список сотрудников с категорией допуска: ")
 print(result)
\ No newline at end of file
@@ -4,10 +4,7 @@ zones = [
     {"zone": "Research Wing", "active_from": 9, "active_to": 17}
 ]
 
-day_zones = list(filter(
-    lambda zone: (zone["active_from"] >= 8) and (zone["active_to"] <= 18),
-    zones
-))
+day_zones = [zone for zone in zones if zone["active_from"] >= 8 and zone["active_to"] <= 18]
 
 print("Зоны, работающие в дневной период с 8 до 18: ")
 print(day_zones)
\ No newline at end of file
@@ -1,3 +1,21 @@
+import json
+import os
+import re
+import sys
+import time
+from multiprocessing import Pool
+
+# Ссылки с поддерживаемыми схемами в любом регистре. Скобки и кавычки входят в ссылку,
+# только если они парные (wiki/Foo_(bar), ?q="1"), иначе это обрамление ссылки в тексте;
+# знаки препинания в конце ссылке не принадлежат
+URL_PATTERN = re.compile(
+    r"(?:https?|ftps?)://"
+    r"(?:[^\s<>\"'()\[\]]|\([^\s<>()]*\)|\[[^\s<>\[\]]*\]|\"[^\s<>\"]*\"|'[^\s<>']*')+"
+    r"(?<![.,;:!?])",
+    re.IGNORECASE
+)
+REDACTED = "ДАННЫЕ[ УДАЛЕНЫ]"
+
 reports = [
     {"author": "Dr. Moss", "text": "Analysis completed. Reference: http://external-archive.net"},
     {"author": "Agent Lee", "text": "Incident resolved without escalation."},
@@ -16,16 +34,50 @@ reports = [
     {"author": "Operations Lead Grant", "text": "Emergency protocol draft shared via https://ops-share.scp"}
 ]
 
-filtered_reports_sanitized = list(map(
-    lambda r: {
-        "author": r["author"],
-        "text": (lambda t: " ".join(
-            "ДАННЫЕ[ УДАЛЕНЫ]" if w.startswith(("http://", "https://")) else w
-            for w in t.split()
-        ))(r["text"])
-    },
-    filter(
-        lambda r: "http://" in r["text"] or "https://" in r["text"],
-        reports
-    )
-))
\ No newline at end of file
+
+def sanitize(report):
+    """Отчёт с удалёнными ссылками или None, если ссылок в нём нет"""
+    text, count = URL_PATTERN.subn(REDACTED, report["text"])
+    return {"author": report["author"], "text": text} if count else None
+
+
+def sanitize_line(numbered_line):
+    """То же для пронумерованной строки JSONL: (номер, строка JSONL или None, ошибка или None)"""
+    number, line = numbered_line
+    try:
+        report = sanitize(json.loads(line))
+    except json.JSONDecodeError as e:
+        return number, None, f"ошибка разбора JSON: {e}"
+    except (KeyError, TypeError):
+        return number, None, "ожидается объект с полями author и text"
+    return number, json.dumps(report, ensure_ascii=False) + "\n" if report else None, None
+
+
+def sanitize_files(paths, out, workers=None, errors=sys.stderr):
+    """Потоковая обработка файлов JSONL в нескольких процессах, возвращает объём в байтах.
+
+    Неверные строки пропускаются, о каждой пишется в errors с номером строки.
+    """
+    with Pool(workers) as pool:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                lines = ((number, line) for number, line in enumerate(f, 1) if line.strip())
+                for number, result, error in pool.imap(sanitize_line, lines, chunksize=1000):
+                    if error:
+                        print(f"{path}:{number}: {error}", file=errors)
+                    elif result:
+                        out.write(result)
+    return sum(os.path.getsize(path) for path in paths)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # python "задание 5.py" отчёты.jsonl ... — результат в stdout, скорость в stderr
+        start = time.perf_counter()
+        size = sanitize_files(sys.argv[1:], sys.stdout)
+        elapsed = time.perf_counter() - start
+        print(f"Обработано {size / 2**20:.1f} МБ за {elapsed:.2f} с ({size / 2**20 / elapsed:.1f} МБ/с)", file=sys.stderr)
+    else:
+        filtered_reports_sanitized = [report for report in map(sanitize, reports) if report]
+        print("Отчёты с удалёнными ссылками: ")
+        print(filtered_reports_sanitized)
@@ -6,7 +6,7 @@ scp_objects = [
     {"scp": "SCP-3001", "class": "Keter"}
 ]
 
-enhanced_security_scps = list(filter(lambda obj: obj["class"] != "Safe", scp_objects))
+enhanced_security_scps = [obj for obj in scp_objects if obj["class"] != "Safe"]
 
 print("Список SCP-объектов, которые требуют усиленных мер содержания: ")
 print(enhanced_security_scps)
\ No newline at end of file
@@ -1,3 +1,6 @@
+import heapq
+from operator import itemgetter
+
 incidents = [
     {"id": 101, "staff": 4},
     {"id": 102, "staff": 12},
@@ -5,7 +8,7 @@ incidents = [
     {"id": 104, "staff": 20}
 ]
 
-top_incidents = sorted(incidents, key=lambda x: x["staff"], reverse=True)[:3]
+top_incidents = heapq.nlargest(3, incidents, key=itemgetter("staff"))  # куча на 3 элемента вместо полной сортировки
 
 print("Самые ресурсоемкие инциденты: ")
 print(top_incidents)
\ No newline at end of file